@@ -9,8 +9,6 @@ to extract figures, tables, and text from PDF documents.
 import os
 from pathlib import Path
 
-from quanta import extract_document
-
 def basic_example():
     """Basic example of processing a single PDF"""
     print("🔍 PDF Layout Analysis Engine - Basic Example")
@@ -32,6 +30,10 @@ def basic_example():
     
     # Process the PDF
     try:
+        # Deferred so the checks above run without loading the pipeline's
+        # heavy dependencies
+        from quanta import extract_document
+        
         print("🚀 Starting processing...")
         result = extract_document(pdf_path, output_dir)
         
@@ -11,11 +11,63 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from runner import process_pdf
+# Add the repository root to the path so the pipeline imports as the src package
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+def _process_one(pdf_path, pdf_output_dir):
+    """
+    Process a single PDF and return its summary record
+    
+    Runs inside a worker process, so errors are captured in the returned
+    record instead of being raised back into the pool.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        pdf_output_dir (str): Output directory for this PDF
+    """
+    filename = os.path.basename(pdf_path)
+    
+    try:
+        # Imported here so the pipeline (PyMuPDF, OpenCV, numpy, ...) is only
+        # loaded by the workers that actually process PDFs
+        from src.core.pipeline_processor import process_pdf
+        
+        result = process_pdf(pdf_path, pdf_output_dir)
+        
+        # Count results
+        pdf_figures = sum(len(p.get('figures', [])) for p in result['pages'])
+        pdf_tables = sum(len(p.get('tables', [])) for p in result['pages'])
+        
+        return {
+            'filename': filename,
+            'pages': len(result['pages']),
+            'figures': pdf_figures,
+            'tables': pdf_tables,
+            'output_dir': pdf_output_dir,
+            'status': 'success'
+        }
+        
+    except Exception as e:
+        return _error_record(filename, e)
+
+def _error_record(filename, error):
+    """Build the summary record for a PDF that could not be processed"""
+    return {
+        'filename': filename,
+        'pages': 0,
+        'figures': 0,
+        'tables': 0,
+        'output_dir': None,
+        'status': 'error',
+        'error': str(error)
+    }
 
 def batch_process_pdfs(input_dir, output_dir):
     """
@@ -28,9 +80,13 @@ def batch_process_pdfs(input_dir, output_dir):
     print("🔄 PDF Layout Analysis Engine - Batch Processing")
     print("=" * 60)
     
-    # Find all PDF files
-    input_path = Path(input_dir)
-    pdf_files = list(input_path.glob("*.pdf"))
+    # Find all PDF files (scandir reuses directory entry info instead of
+    # stat-ing every file, which matters for large input folders)
+    with os.scandir(input_dir) as entries:
+        pdf_files = sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.lower().endswith('.pdf') and entry.is_file(follow_symlinks=False)
+        )
     
     if not pdf_files:
         print(f"❌ No PDF files found in {input_dir}")
@@ -43,103 +99,118 @@ def batch_process_pdfs(input_dir, output_dir):
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
-    # Process each PDF
-    results = []
-    total_figures = 0
-    total_tables = 0
+    # Process PDFs in parallel - each PDF is independent, so fan out across cores.
+    # Per-file records are streamed to a JSONL log as they finish; only the
+    # aggregate counters (and failures, for the final printout) stay in memory.
+    stats = {
+        'total_files': 0,
+        'successful': 0,
+        'total_pages': 0,
+        'total_figures': 0,
+        'total_tables': 0,
+        'failed': []
+    }
     
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"📄 Processing {i}/{len(pdf_files)}: {pdf_file.name}")
+    files_log_path = os.path.join(output_dir, 'batch_report.jsonl')
+    with open(files_log_path, 'wb') as files_log, \
+            ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(_process_one, str(pdf_file), os.path.join(output_dir, pdf_file.stem)): pdf_file
+            for pdf_file in pdf_files
+        }
         
-        try:
-            # Create individual output directory
-            pdf_output_dir = os.path.join(output_dir, pdf_file.stem)
-            
-            # Process the PDF
-            result = process_pdf(str(pdf_file), pdf_output_dir)
-            
-            # Count results
-            pdf_figures = sum(len(p.get('figures', [])) for p in result['pages'])
-            pdf_tables = sum(len(p.get('tables', [])) for p in result['pages'])
-            
-            total_figures += pdf_figures
-            total_tables += pdf_tables
-            
-            # Store result summary
-            results.append({
-                'filename': pdf_file.name,
-                'pages': len(result['pages']),
-                'figures': pdf_figures,
-                'tables': pdf_tables,
-                'output_dir': pdf_output_dir,
-                'status': 'success'
-            })
-            
-            print(f"   ✅ Success: {pdf_figures} figures, {pdf_tables} tables")
+        for i, future in enumerate(as_completed(futures), 1):
+            pdf_file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # _process_one catches pipeline errors, so this is the worker
+                # itself dying (e.g. BrokenProcessPool); record it and go on
+                result = _error_record(pdf_file.name, e)
+            files_log.write(_dumps_line(result))
+            stats['total_files'] += 1
             
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results.append({
-                'filename': pdf_file.name,
-                'pages': 0,
-                'figures': 0,
-                'tables': 0,
-                'output_dir': None,
-                'status': 'error',
-                'error': str(e)
-            })
-        
-        print()
+            print(f"📄 Processed {i}/{len(pdf_files)}: {pdf_file.name}")
+            if result['status'] == 'success':
+                stats['successful'] += 1
+                stats['total_pages'] += result['pages']
+                stats['total_figures'] += result['figures']
+                stats['total_tables'] += result['tables']
+                print(f"   ✅ Success: {result['figures']} figures, {result['tables']} tables")
+            else:
+                stats['failed'].append(result)
+                print(f"   ❌ Error: {result['error']}")
+            print()
     
     # Generate batch report
-    generate_batch_report(results, output_dir, total_figures, total_tables)
+    generate_batch_report(stats, output_dir)
     
     print("🎉 Batch processing complete!")
-    print(f"📊 Total results: {total_figures} figures, {total_tables} tables")
+    print(f"📊 Total results: {stats['total_figures']} figures, {stats['total_tables']} tables")
     print(f"📄 Batch report: {os.path.join(output_dir, 'batch_report.json')}")
+    print(f"📄 Per-file log: {files_log_path}")
+
+def _dumps_line(record):
+    """Serialize one record as a JSONL line (bytes)"""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode('utf-8')
 
-def generate_batch_report(results, output_dir, total_figures, total_tables):
-    """Generate a comprehensive batch processing report"""
+def generate_batch_report(stats, output_dir):
+    """
+    Generate the aggregate batch processing report
     
-    # Calculate statistics
-    successful = [r for r in results if r['status'] == 'success']
-    failed = [r for r in results if r['status'] == 'error']
+    Per-file records are already in batch_report.jsonl; this writes the
+    summary and statistics to batch_report.json.
     
-    total_pages = sum(r['pages'] for r in successful)
+    Args:
+        stats (dict): Aggregate counters collected while processing
+        output_dir (str): Output directory for results
+    """
+    total_files = stats['total_files']
+    successful = stats['successful']
+    failed = stats['failed']
+    total_pages = stats['total_pages']
+    total_figures = stats['total_figures']
+    total_tables = stats['total_tables']
     
     # Create report
     report = {
         'timestamp': datetime.now().isoformat(),
         'summary': {
-            'total_files': len(results),
-            'successful': len(successful),
+            'total_files': total_files,
+            'successful': successful,
             'failed': len(failed),
             'total_pages': total_pages,
             'total_figures': total_figures,
             'total_tables': total_tables
         },
-        'files': results,
+        'files_log': 'batch_report.jsonl',
         'statistics': {
             'avg_figures_per_page': total_figures / total_pages if total_pages > 0 else 0,
             'avg_tables_per_page': total_tables / total_pages if total_pages > 0 else 0,
-            'success_rate': len(successful) / len(results) if results else 0
+            'success_rate': successful / total_files if total_files else 0
         }
     }
     
     # Save report
     report_path = os.path.join(output_dir, 'batch_report.json')
-    with open(report_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
     
     # Print summary
     print("📊 Batch Processing Summary:")
-    print(f"   Files processed: {len(results)}")
-    print(f"   Successful: {len(successful)}")
+    print(f"   Files processed: {total_files}")
+    print(f"   Successful: {successful}")
     print(f"   Failed: {len(failed)}")
     print(f"   Total pages: {total_pages}")
     print(f"   Total figures: {total_figures}")
     print(f"   Total tables: {total_tables}")
-    print(f"   Success rate: {len(successful)/len(results)*100:.1f}%")
+    print(f"   Success rate: {successful/total_files*100:.1f}%")
     
     if failed:
         print(f"\n❌ Failed files:")
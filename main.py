@@ -7,42 +7,79 @@ Processes all PDFs in test_pdf folder and saves outputs to individual folders in
 import os
 import sys
 import logging
+import multiprocessing
+import queue
+import threading
+from itertools import repeat
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict, Any
-
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Tuple
 
 # Import the processing modules
-from src.core.pipeline_processor import process_pdf, setup_logging
+from src.core.pipeline_processor import process_pdf, setup_logging, limit_worker_threads
 import cv2
 import numpy as np
 
-def setup_logging_config():
-    """Setup logging configuration"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('pdf_processing.log')
-        ]
-    )
+def setup_logging_config() -> Tuple[Any, QueueListener]:
+    """
+    Setup logging configuration
+    
+    Records from this process and from the PDF worker processes are put on one
+    queue; a listener thread does the console/file writes off the hot path.
+    
+    Returns:
+        (log queue to hand to worker processes, started listener - pass it to
+        shutdown_logging when done)
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler('pdf_processing.log')
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    _route_logging_to(log_queue)
+    return log_queue, listener
+
+def _route_logging_to(log_queue: Any) -> None:
+    """Replace the root logger's handlers with a single QueueHandler"""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+def shutdown_logging(listener: QueueListener) -> None:
+    """Flush and stop the listener, detach the root QueueHandler and close the real handlers"""
+    listener.stop()
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+        root.removeHandler(handler)
+        handler.close()
+    for handler in listener.handlers:
+        handler.close()
+
+def _init_pdf_worker(log_queue: Any) -> None:
+    """PDF worker process initializer: log through the parent and cap native threads"""
+    _route_logging_to(log_queue)
+    limit_worker_threads()
 
 def get_pdf_files(test_pdf_dir: str) -> List[str]:
     """Get all PDF files from test_pdf directory"""
     pdf_files = []
-    test_pdf_path = Path(test_pdf_dir)
     
-    if not test_pdf_path.exists():
+    if not os.path.isdir(test_pdf_dir):
         logging.error(f"Test PDF directory not found: {test_pdf_dir}")
         return pdf_files
     
     # Only process tps51633.pdf for testing
-    target_file = test_pdf_path / "tps51633.pdf"
-    if target_file.exists():
-        pdf_files.append(str(target_file))
-        logging.info(f"Found target PDF: {target_file.name}")
+    target_file = os.path.join(test_pdf_dir, "tps51633.pdf")
+    if os.path.isfile(target_file):
+        pdf_files.append(target_file)
+        logging.info(f"Found target PDF: {os.path.basename(target_file)}")
     else:
         logging.error(f"Target PDF not found: {target_file}")
     
@@ -55,136 +92,303 @@ def create_output_folder(pdf_path: str, base_output_dir: str) -> str:
     os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
-def process_pdf_debug(pdf_path: str, output_dir: str) -> Dict[str, Any]:
-    """Process PDF in debug mode - generate layout overlays with colored box annotations"""
-    from src.core.pipeline_processor import process_pdf
+# Overlay colors (BGR) and label font
+COLUMN_COLOR = (255, 0, 0)
+TEXT_COLOR = (0, 255, 0)
+FIGURE_COLOR = (0, 0, 255)
+TABLE_COLOR = (0, 255, 255)
+LEGEND_TITLE_COLOR = (255, 255, 255)
+OVERLAY_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+def draw_boxes(overlay: np.ndarray, bboxes: List[List[int]], color: tuple, thickness: int) -> None:
+    """Outline every [x0, y0, x1, y1] box in one cv2.polylines call"""
+    if not bboxes:
+        return
+    b = np.asarray(bboxes, dtype=np.int32).reshape(-1, 4)
+    corners = np.stack([b[:, [0, 1]], b[:, [2, 1]], b[:, [2, 3]], b[:, [0, 3]]], axis=1)
+    cv2.polylines(overlay, list(corners), True, color, thickness)
+
+# Legend glyphs, rasterized once on first use: (pixels, mask of drawn pixels)
+LEGEND_SIZE = (130, 240)  # (height, width) in pixels from the page's top-left corner
+_legend_patch = None
+
+def paste_legend(overlay: np.ndarray) -> None:
+    """Stamp the cached legend text into the top-left corner of the overlay"""
+    global _legend_patch
+    if _legend_patch is None:
+        legend = np.zeros(LEGEND_SIZE + (3,), dtype=np.uint8)
+        legend_y = 30
+        cv2.putText(legend, "LEGEND:", (10, legend_y), OVERLAY_FONT, 0.6, LEGEND_TITLE_COLOR, 2)
+        legend_y += 25
+        cv2.putText(legend, "Blue = Columns", (10, legend_y), OVERLAY_FONT, 0.5, COLUMN_COLOR, 2)
+        legend_y += 20
+        cv2.putText(legend, "Green = Text Blocks", (10, legend_y), OVERLAY_FONT, 0.5, TEXT_COLOR, 2)
+        legend_y += 20
+        cv2.putText(legend, "Red = Figures", (10, legend_y), OVERLAY_FONT, 0.5, FIGURE_COLOR, 2)
+        legend_y += 20
+        cv2.putText(legend, "Yellow = Tables", (10, legend_y), OVERLAY_FONT, 0.5, TABLE_COLOR, 2)
+        # Only glyph pixels are copied, so the page still shows between letters
+        _legend_patch = (legend, legend.any(axis=2))
+    
+    legend, mask = _legend_patch
+    h = min(legend.shape[0], overlay.shape[0])
+    w = min(legend.shape[1], overlay.shape[1])
+    np.copyto(overlay[:h, :w], legend[:h, :w], where=mask[:h, :w, None])
+
+# Debug overlays: fast (low) PNG compression level and downscale factor.
+# Overlays are only inspected by eye, so encode speed beats file size.
+DEBUG_PNG_COMPRESSION = 1
+DEBUG_OVERLAY_SCALE = 1.0
+
+# PDF worker processes; PyMuPDF throughput tends to flatten out past 4-6
+DEFAULT_PDF_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Threads used to draw and encode debug overlays
+OVERLAY_WORKERS = 4
+
+# Encoded overlays allowed to wait for the writer thread
+OVERLAY_WRITE_QUEUE_SIZE = 4
+
+# Per-thread overlay buffer for _render_overlay
+_overlay_scratch = threading.local()
+
+# Seconds a renderer waits on a full write queue before checking the writer is alive
+OVERLAY_PUT_TIMEOUT = 1.0
+
+class _OverlayWriter:
+    """Background thread that writes encoded overlays, fed through a bounded queue"""
+    
+    def __init__(self, maxsize: int = OVERLAY_WRITE_QUEUE_SIZE):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        """Write queued overlays to disk until the None sentinel arrives"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            debug_path, png = item
+            try:
+                Path(debug_path).write_bytes(png)
+                logging.debug(f"Saved debug overlay: {debug_path}")
+            except Exception as e:
+                # Keep draining so producers never block on a full queue
+                logging.error(f"Failed to save debug overlay {debug_path}: {e}")
+    
+    def _put(self, item: Any) -> bool:
+        """Queue an item, giving up (False) if the writer thread has died"""
+        while True:
+            try:
+                self._queue.put(item, timeout=OVERLAY_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                if not self._thread.is_alive():
+                    return False
+    
+    def write(self, debug_path: str, png: np.ndarray) -> None:
+        """Queue an encoded overlay for writing"""
+        if not self._put((debug_path, png)):
+            raise RuntimeError(f"Debug overlay writer stopped; could not save {debug_path}")
+    
+    def close(self) -> None:
+        """Flush pending overlays and stop the writer thread"""
+        self._put(None)
+        self._thread.join()
+
+def _render_overlay(page_data: Dict[str, Any], output_dir: str, writer: _OverlayWriter,
+                    png_compression: int = DEBUG_PNG_COMPRESSION,
+                    scale: float = DEBUG_OVERLAY_SCALE) -> None:
+    """Draw and encode the layout overlay for one page and queue it for writing"""
+    # Nothing to annotate (blank page, cover art without text); skip the copy and encode
+    if not (page_data.get('columns') or page_data.get('text_blocks')
+            or page_data.get('figures') or page_data.get('tables')):
+        return
     
+    page_num = page_data['page_num']
+    img_page = page_data['img_page']
+    put_text = cv2.putText
+    
+    # Create overlay image in this thread's buffer, reallocated only when the
+    # page size changes
+    overlay = getattr(_overlay_scratch, 'buf', None)
+    if overlay is None or overlay.shape != img_page.shape:
+        overlay = _overlay_scratch.buf = np.empty_like(img_page)
+    np.copyto(overlay, img_page)
+    
+    # Draw columns (Blue boxes)
+    columns = page_data.get('columns', [])
+    draw_boxes(overlay, [[col_x0, 0, col_x1, overlay.shape[0]] for col_x0, col_x1 in columns], COLUMN_COLOR, 3)
+    for i, (col_x0, col_x1) in enumerate(columns):
+        put_text(overlay, f"Col{i+1}", (col_x0+5, 30), OVERLAY_FONT, 0.6, COLUMN_COLOR, 2)
+    
+    # Draw text blocks (Green boxes)
+    text_bboxes = [block.bbox_px if hasattr(block, 'bbox_px') else [0, 0, 0, 0]
+                   for block in page_data.get('text_blocks', [])]
+    draw_boxes(overlay, text_bboxes, TEXT_COLOR, 2)
+    for i, bbox in enumerate(text_bboxes):
+        put_text(overlay, f"T{i+1}", (bbox[0], bbox[1]-5), OVERLAY_FONT, 0.5, TEXT_COLOR, 1)
+    
+    # Draw figures (Red boxes)
+    figures = page_data.get('figures', [])
+    draw_boxes(overlay, [figure.bbox_px for figure in figures], FIGURE_COLOR, 3)
+    for i, figure in enumerate(figures):
+        bbox = figure.bbox_px
+        put_text(overlay, f"FIGURE {i+1}", (bbox[0], bbox[1]-10), OVERLAY_FONT, 0.7, FIGURE_COLOR, 2)
+        # Add confidence score if available
+        if hasattr(figure, 'confidence'):
+            put_text(overlay, f"({figure.confidence:.2f})", (bbox[0], bbox[1]+20), OVERLAY_FONT, 0.5, FIGURE_COLOR, 1)
+    
+    # Draw tables (Yellow boxes)
+    tables = page_data.get('tables', [])
+    draw_boxes(overlay, [table.bbox_px for table in tables], TABLE_COLOR, 3)
+    for i, table in enumerate(tables):
+        bbox = table.bbox_px
+        put_text(overlay, f"TABLE {i+1}", (bbox[0], bbox[1]-10), OVERLAY_FONT, 0.7, TABLE_COLOR, 2)
+        # Add confidence score if available
+        if hasattr(table, 'confidence'):
+            put_text(overlay, f"({table.confidence:.2f})", (bbox[0], bbox[1]+20), OVERLAY_FONT, 0.5, TABLE_COLOR, 1)
+    
+    # Add legend
+    paste_legend(overlay)
+    
+    # Shrink the finished overlay before encoding; fewer pixels to compress
+    encoded = overlay
+    if scale < 1.0:
+        encoded = cv2.resize(overlay, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
+    # Save debug overlay
+    debug_path = os.path.join(output_dir, f"page_{page_num+1:02d}_debug_overlay.png")
+    # Overlays are throwaway previews; fast zlib level over smallest file, and
+    # RLE suits their flat page background with thin colored lines.
+    # Encode in memory; the writer thread gives the file one contiguous write.
+    ok, png = cv2.imencode('.png', encoded, [cv2.IMWRITE_PNG_COMPRESSION, png_compression,
+                                             cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE])
+    if not ok:
+        raise RuntimeError(f"Failed to encode debug overlay for page {page_num+1}")
+    writer.write(debug_path, png)
+
+def process_pdf_debug(pdf_path: str, output_dir: str,
+                      png_compression: int = DEBUG_PNG_COMPRESSION,
+                      overlay_scale: float = DEBUG_OVERLAY_SCALE) -> Dict[str, Any]:
+    """Process PDF in debug mode - generate layout overlays with colored box annotations"""
     # Process normally first
     result = process_pdf(pdf_path, output_dir)
     
-    # Generate debug overlays for each page
-    for page_data in result['pages']:
-        page_num = page_data['page_num']
-        img_page = page_data['img_page']
-        
-        # Create overlay image
-        overlay = img_page.copy()
-        
-        # Draw columns (Blue boxes)
-        for i, (col_x0, col_x1) in enumerate(page_data.get('columns', [])):
-            cv2.rectangle(overlay, (col_x0, 0), (col_x1, overlay.shape[0]), (255, 0, 0), 3)
-            cv2.putText(overlay, f"Col{i+1}", (col_x0+5, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
-        
-        # Draw text blocks (Green boxes)
-        for i, block in enumerate(page_data.get('text_blocks', [])):
-            bbox = block.bbox_px if hasattr(block, 'bbox_px') else [0, 0, 0, 0]
-            cv2.rectangle(overlay, (bbox[0], bbox[1]), (bbox[2], bbox[3]), (0, 255, 0), 2)
-            cv2.putText(overlay, f"T{i+1}", (bbox[0], bbox[1]-5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-        
-        # Draw figures (Red boxes)
-        for i, figure in enumerate(page_data.get('figures', [])):
-            bbox = figure.bbox_px
-            cv2.rectangle(overlay, (bbox[0], bbox[1]), (bbox[2], bbox[3]), (0, 0, 255), 3)
-            cv2.putText(overlay, f"FIGURE {i+1}", (bbox[0], bbox[1]-10), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-            # Add confidence score if available
-            if hasattr(figure, 'confidence'):
-                cv2.putText(overlay, f"({figure.confidence:.2f})", (bbox[0], bbox[1]+20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+    # Generate debug overlays for each page; drawing and PNG encoding run in
+    # OpenCV with the GIL released, so pages overlap on threads while a single
+    # writer drains finished PNGs to disk. The bounded queue caps how many
+    # encoded overlays are held in memory.
+    writer = _OverlayWriter()
+    try:
+        with ThreadPoolExecutor(max_workers=OVERLAY_WORKERS) as executor:
+            list(executor.map(_render_overlay, result['pages'], repeat(output_dir), repeat(writer),
+                              repeat(png_compression), repeat(overlay_scale)))
+    finally:
+        writer.close()
+    
+    return result
+
+def _process_one(pdf_path: str, output_dir: str, debug_mode: bool,
+                 png_compression: int = DEBUG_PNG_COMPRESSION,
+                 overlay_scale: float = DEBUG_OVERLAY_SCALE) -> Dict[str, Any]:
+    """
+    Process one PDF in a worker process
+    
+    Only plain strings/ints cross the process boundary; page data stays in the worker.
+    Reporting is left to the parent, which logs each record as it comes back.
+    output_dir must already exist - the parent creates all of them before dispatch.
+    
+    Returns:
+        {'name', 'output_dir', 'pages', 'figures', 'tables', 'error': message or None}
+    """
+    record = {'name': Path(pdf_path).name, 'output_dir': output_dir,
+              'pages': 0, 'figures': 0, 'tables': 0, 'error': None}
+    try:
+        # Process the PDF
+        if debug_mode:
+            result = process_pdf_debug(pdf_path, output_dir, png_compression, overlay_scale)
+        else:
+            result = process_pdf(pdf_path, output_dir)
         
-        # Draw tables (Yellow boxes)
-        for i, table in enumerate(page_data.get('tables', [])):
-            bbox = table.bbox_px
-            cv2.rectangle(overlay, (bbox[0], bbox[1]), (bbox[2], bbox[3]), (0, 255, 255), 3)
-            cv2.putText(overlay, f"TABLE {i+1}", (bbox[0], bbox[1]-10), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-            # Add confidence score if available
-            if hasattr(table, 'confidence'):
-                cv2.putText(overlay, f"({table.confidence:.2f})", (bbox[0], bbox[1]+20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+        # Count results
+        pdf_figures = pdf_tables = 0
+        for page in result['pages']:
+            pdf_figures += len(page.get('figures', ()))
+            pdf_tables += len(page.get('tables', ()))
         
-        # Add legend
-        legend_y = 30
-        cv2.putText(overlay, "LEGEND:", (10, legend_y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        legend_y += 25
-        cv2.putText(overlay, "Blue = Columns", (10, legend_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-        legend_y += 20
-        cv2.putText(overlay, "Green = Text Blocks", (10, legend_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-        legend_y += 20
-        cv2.putText(overlay, "Red = Figures", (10, legend_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
-        legend_y += 20
-        cv2.putText(overlay, "Yellow = Tables", (10, legend_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
+        record.update(pages=len(result['pages']), figures=pdf_figures, tables=pdf_tables)
         
-        # Save debug overlay
-        debug_path = os.path.join(output_dir, f"page_{page_num+1:02d}_debug_overlay.png")
-        cv2.imwrite(debug_path, overlay)
-        logging.info(f"Saved debug overlay: {debug_path}")
+    except Exception as e:
+        record['error'] = str(e)
     
-    return result
+    return record
 
-def process_all_pdfs(debug_mode=False):
+def process_all_pdfs(debug_mode=False, png_compression=DEBUG_PNG_COMPRESSION, workers=DEFAULT_PDF_WORKERS,
+                     overlay_scale=DEBUG_OVERLAY_SCALE):
     """Main function to process all PDFs in test_pdf folder"""
-    setup_logging_config()
+    log_queue, listener = setup_logging_config()
+    try:
+        # Configuration
+        test_pdf_dir = "test_pdf"
+        base_output_dir = "output"
     
-    # Configuration
-    test_pdf_dir = "test_pdf"
-    base_output_dir = "output"
+        if debug_mode:
+            logging.info("🔍 DEBUG MODE: Will generate layout overlays instead of extracting images")
     
-    if debug_mode:
-        logging.info("🔍 DEBUG MODE: Will generate layout overlays instead of extracting images")
+        # Get all PDF files
+        pdf_files = get_pdf_files(test_pdf_dir)
     
-    # Get all PDF files
-    pdf_files = get_pdf_files(test_pdf_dir)
+        if not pdf_files:
+            logging.error(f"No PDF files found in {test_pdf_dir} directory")
+            return
     
-    if not pdf_files:
-        logging.error(f"No PDF files found in {test_pdf_dir} directory")
-        return
+        logging.info(f"Found {len(pdf_files)} PDF files to process")
+    
+        # Process PDFs in parallel, one per worker process; each worker returns a
+        # plain record and the parent reports and totals them as they finish, so
+        # a slow PDF doesn't hold up the rest
+        total_figures = 0
+        total_tables = 0
+        processed_count = 0
+        max_workers = min(workers, len(pdf_files))
+        
+        # Create every PDF's output folder up front, so workers only write into them
+        output_dirs = [create_output_folder(pdf_path, base_output_dir) for pdf_path in pdf_files]
+    
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_pdf_worker,
+                                 initargs=(log_queue,)) as executor:
+            futures = [executor.submit(_process_one, pdf_path, output_dir, debug_mode, png_compression,
+                                       overlay_scale)
+                       for pdf_path, output_dir in zip(pdf_files, output_dirs)]
+        
+            for i, future in enumerate(as_completed(futures), 1):
+                record = future.result()
+                if record['error'] is not None:
+                    logging.error(f"❌ Error processing {record['name']} ({i}/{len(pdf_files)}): {record['error']}")
+                    continue
+                
+                logging.info(f"✅ Completed {record['name']} ({i}/{len(pdf_files)})")
+                logging.info(f"   Pages processed: {record['pages']}")
+                logging.info(f"   Figures found: {record['figures']}")
+                logging.info(f"   Tables found: {record['tables']}")
+                logging.info(f"   Output saved to: {record['output_dir']}")
+                
+                total_figures += record['figures']
+                total_tables += record['tables']
+                processed_count += 1
     
-    logging.info(f"Found {len(pdf_files)} PDF files to process")
-    
-    # Process each PDF
-    total_figures = 0
-    total_tables = 0
-    processed_count = 0
-    
-    for i, pdf_path in enumerate(pdf_files, 1):
-        try:
-            pdf_name = Path(pdf_path).name
-            logging.info(f"\n{'='*60}")
-            logging.info(f"Processing PDF {i}/{len(pdf_files)}: {pdf_name}")
-            logging.info(f"{'='*60}")
-            
-            # Create output folder for this PDF
-            output_dir = create_output_folder(pdf_path, base_output_dir)
-            
-            # Process the PDF
-            if debug_mode:
-                result = process_pdf_debug(pdf_path, output_dir)
-            else:
-                result = process_pdf(pdf_path, output_dir)
-            
-            # Count results
-            pdf_figures = sum(len(p.get('figures', [])) for p in result['pages'])
-            pdf_tables = sum(len(p.get('tables', [])) for p in result['pages'])
-            
-            total_figures += pdf_figures
-            total_tables += pdf_tables
-            processed_count += 1
-            
-            logging.info(f"✅ Completed {pdf_name}")
-            logging.info(f"   Pages processed: {len(result['pages'])}")
-            logging.info(f"   Figures found: {pdf_figures}")
-            logging.info(f"   Tables found: {pdf_tables}")
-            logging.info(f"   Output saved to: {output_dir}")
-            
-        except Exception as e:
-            logging.error(f"❌ Error processing {pdf_name}: {e}")
-            continue
-    
-    # Final summary
-    logging.info(f"\n{'='*60}")
-    logging.info(f"PROCESSING COMPLETE")
-    logging.info(f"{'='*60}")
-    logging.info(f"PDFs processed: {processed_count}/{len(pdf_files)}")
-    logging.info(f"Total figures extracted: {total_figures}")
-    logging.info(f"Total tables extracted: {total_tables}")
-    logging.info(f"Output directory: {base_output_dir}/")
+        # Final summary
+        logging.info(f"\n{'='*60}")
+        logging.info(f"PROCESSING COMPLETE")
+        logging.info(f"{'='*60}")
+        logging.info(f"PDFs processed: {processed_count}/{len(pdf_files)}")
+        logging.info(f"Total figures extracted: {total_figures}")
+        logging.info(f"Total tables extracted: {total_tables}")
+        logging.info(f"Output directory: {base_output_dir}/")
+    finally:
+        shutdown_logging(listener)
 
 def main():
     """Entry point"""
@@ -194,8 +398,21 @@ def main():
     parser.add_argument("--debug", action="store_true", help="Enable debug mode (show layout overlays)")
     parser.add_argument("--mode", choices=["extract", "debug"], default="extract", 
                        help="Processing mode: extract images or show debug overlays")
+    parser.add_argument("--overlay-compress", type=int, choices=range(10), default=DEBUG_PNG_COMPRESSION,
+                       metavar="N", help="PNG compression level 0-9 for debug overlays "
+                                         f"(default: {DEBUG_PNG_COMPRESSION}, fast encode)")
+    parser.add_argument("--overlay-scale", type=float, default=DEBUG_OVERLAY_SCALE, metavar="S",
+                       help="Downscale debug overlays by this factor (0 < S <= 1) before saving; "
+                            "smaller is faster to encode (default: full size)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_PDF_WORKERS, metavar="N",
+                       help="Number of PDFs processed in parallel; 4-6 is usually the sweet spot, "
+                            f"more mostly adds overhead (default: {DEFAULT_PDF_WORKERS})")
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not 0 < args.overlay_scale <= 1:
+        parser.error("--overlay-scale must be in (0, 1]")
     debug_mode = args.debug or args.mode == "debug"
     
     print("🚀 Starting PDF Processing Pipeline")
@@ -219,14 +436,14 @@ def main():
         sys.exit(1)
     
     print(f"📁 Found {len(pdf_files)} PDF files to process:")
-    for pdf_file in pdf_files:
-        print(f"   - {Path(pdf_file).name}")
+    sys.stdout.write("".join(f"   - {os.path.basename(pdf_file)}\n" for pdf_file in pdf_files))
     
     print(f"\n📤 Output will be saved to: output/")
     print("=" * 50)
     
     # Process all PDFs
-    process_all_pdfs(debug_mode=debug_mode)
+    process_all_pdfs(debug_mode=debug_mode, png_compression=args.overlay_compress, workers=args.workers,
+                     overlay_scale=args.overlay_scale)
 
 if __name__ == "__main__":
     main()
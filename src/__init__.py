@@ -33,16 +33,36 @@ __author__ = "PDF Layout Analysis Team"
 __email__ = "team@pdf-layout-engine.org"
 __license__ = "MIT"
 
-# Import main functions for easy access
-from .core.pipeline_processor import process_pdf, process_page
-from .core.pdf_handler import load_pdf_page_data, render_page
-from .detection.column_detector import detect_columns
-from .detection.text_detector import extract_text_blocks, group_lines_into_paragraphs
-from .detection.figure_detector import detect_figures
-from .detection.table_detector import extract_tables
-from .processing.caption_processor import link_captions
-from .processing.content_organizer import assemble_sections
-from .core.output_manager import write_page_outputs
+import importlib
+
+# Public functions and the submodule that defines each one. They are imported
+# on first attribute access (PEP 562) so `import src` - or importing any one
+# subpackage through it - doesn't load the whole pipeline up front.
+_LAZY_EXPORTS = {
+    'process_pdf': '.core.pipeline_processor',
+    'process_page': '.core.pipeline_processor',
+    'load_pdf_page_data': '.core.pdf_handler',
+    'render_page': '.core.pdf_handler',
+    'detect_columns': '.detection.column_detector',
+    'extract_text_blocks': '.detection.text_detector',
+    'group_lines_into_paragraphs': '.detection.text_detector',
+    'detect_figures': '.detection.figure_detector',
+    'extract_tables': '.detection.table_detector',
+    'link_captions': '.processing.caption_processor',
+    'assemble_sections': '.processing.content_organizer',
+    'write_page_outputs': '.core.output_manager',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     'process_pdf',
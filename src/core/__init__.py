@@ -3,13 +3,14 @@ Core functionality for PDF processing pipeline.
 Contains main runner, PDF I/O operations, and export functionality.
 """
 
-from .pipeline_processor import process_page, process_pdf
+from .pipeline_processor import process_page, process_pdf, process_pdf_parallel
 from .pdf_handler import load_pdf_page_data, get_page_info
 from .output_manager import write_page_outputs, create_summary_report
 
 __all__ = [
     'process_page',
     'process_pdf', 
+    'process_pdf_parallel',
     'load_pdf_page_data',
     'get_page_info',
     'write_page_outputs',
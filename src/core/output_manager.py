@@ -8,10 +8,50 @@ import numpy as np
 import cv2
 from typing import List, Dict, Any, Optional
 import logging
+from collections import Counter
+from concurrent.futures import Executor, Future
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy values for the stdlib encoder; only called for unknown types"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def write_json(data: Any, output_path: str) -> None:
+    """
+    Write data as indented UTF-8 JSON, using orjson when it is installed
+    
+    Args:
+        data: JSON-serializable data (numpy scalars/arrays allowed with orjson)
+        output_path: Path to save JSON file
+    """
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+
+def _submit_io(io_pool: Optional[Executor], writes: List[Future], fn, *args) -> None:
+    """Run a file write on ``io_pool`` if given (collecting its future in ``writes``), otherwise inline"""
+    if io_pool is None:
+        fn(*args)
+        return
+    writes.append(io_pool.submit(fn, *args))
+
 def write_page_outputs(page_num: int, page_data: Dict[str, Any], 
-                      output_dir: str, debug: bool = False) -> Dict[str, Any]:
+                      output_dir: str, debug: bool = False,
+                      io_pool: Optional[Executor] = None,
+                      pending_writes: Optional[List[Future]] = None) -> Dict[str, Any]:
     """
     Write all outputs for a single page with organized directory structure
     
@@ -20,12 +60,17 @@ def write_page_outputs(page_num: int, page_data: Dict[str, Any],
         page_data: Dictionary containing all page data
         output_dir: Output directory
         debug: Whether to generate debug outputs
+        io_pool: Optional executor to run the file writes on
+        pending_writes: With io_pool, a list that receives the write futures
+            instead of waiting for them here; the caller must call .result()
+            on each before relying on the files, so write errors surface
         
     Returns:
         Dictionary with output file paths
     """
     page_name = f"page_{page_num + 1:02d}"  # Zero-padded page numbers
     outputs = {}
+    writes = pending_writes if pending_writes is not None else []
     
     # Create page-specific directory structure
     page_dir = os.path.join(output_dir, page_name)
@@ -43,7 +88,7 @@ def write_page_outputs(page_num: int, page_data: Dict[str, Any],
         for i, figure in enumerate(page_data['figures']):
             fig_filename = f"figure_{i+1:02d}.png"
             fig_path = os.path.join(figures_dir, fig_filename)
-            crop_figure_image(page_data['img_page'], figure, fig_path)
+            _submit_io(io_pool, writes, crop_figure_image, page_data['img_page'], figure, fig_path)
             figure.image_path = fig_path
             outputs[f'figure_{i+1}'] = fig_path
     
@@ -53,7 +98,7 @@ def write_page_outputs(page_num: int, page_data: Dict[str, Any],
             # Table CSV only
             table_csv_filename = f"table_{i+1:02d}.csv"
             table_csv_path = os.path.join(tables_dir, table_csv_filename)
-            save_table_csv(table, table_csv_path)
+            _submit_io(io_pool, writes, save_table_csv, table, table_csv_path)
             outputs[f'table_{i+1}_csv'] = table_csv_path
     
     # Write Mistral text blocks to text directory
@@ -61,27 +106,41 @@ def write_page_outputs(page_num: int, page_data: Dict[str, Any],
         text_filename = "text_blocks.txt"
         text_path = os.path.join(text_dir, text_filename)
         
-        with open(text_path, 'w', encoding='utf-8') as f:
-            for i, text_block in enumerate(page_data['mistral_text_blocks']):
-                f.write(f"Text Block {i+1}:\n")
-                # Handle both dict and list formats
-                if isinstance(text_block, dict):
-                    f.write(f"{text_block.get('text', '')}\n")
-                    f.write(f"BBox: {text_block.get('bbox_px', [0,0,0,0])}\n")
-                else:
-                    f.write(f"{text_block}\n")
-                    f.write(f"BBox: [0,0,0,0]\n")
-                f.write("-" * 50 + "\n")
-        
+        _submit_io(io_pool, writes, write_text_blocks, page_data['mistral_text_blocks'], text_path)
         outputs['text'] = text_path
     
     # Write full page image to page directory
     page_img_path = os.path.join(page_dir, f"{page_name}.png")
-    save_page_image(page_data['img_page'], page_img_path)
+    _submit_io(io_pool, writes, save_page_image, page_data['img_page'], page_img_path)
     outputs['page_image'] = page_img_path
     
+    # Nobody to hand the futures to; wait here so a failed write raises
+    if pending_writes is None:
+        for future in writes:
+            future.result()
+    
     return outputs
 
+def write_text_blocks(text_blocks: List[Any], output_path: str) -> None:
+    """
+    Write Mistral text blocks as a plain-text listing
+    
+    Args:
+        text_blocks: Text blocks as dicts (text/bbox_px) or plain strings
+        output_path: Path to save text file
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for i, text_block in enumerate(text_blocks):
+            f.write(f"Text Block {i+1}:\n")
+            # Handle both dict and list formats
+            if isinstance(text_block, dict):
+                f.write(f"{text_block.get('text', '')}\n")
+                f.write(f"BBox: {text_block.get('bbox_px', [0,0,0,0])}\n")
+            else:
+                f.write(f"{text_block}\n")
+                f.write(f"BBox: [0,0,0,0]\n")
+            f.write("-" * 50 + "\n")
+
 def save_page_image(img: np.ndarray, output_path: str) -> None:
     """
     Save full page image
@@ -171,8 +230,7 @@ def write_page_json(page_data: Dict[str, Any], output_path: str) -> None:
             })
     
     # Write JSON file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False)
+    write_json(json_data, output_path)
 
 def crop_figure_image(img: np.ndarray, figure: Any, output_path: str) -> None:
     """
@@ -192,8 +250,8 @@ def crop_figure_image(img: np.ndarray, figure: Any, output_path: str) -> None:
     x1 = max(x0+1, min(x1, w))
     y1 = max(y0+1, min(y1, h))
     
-    # Crop image
-    cropped = img[y0:y1, x0:x1].copy()
+    # Crop as a view of the already-rendered page; cvtColor makes the only copy
+    cropped = img[y0:y1, x0:x1]
     
     # Convert RGB to BGR for OpenCV
     if len(cropped.shape) == 3 and cropped.shape[2] == 3:
@@ -222,8 +280,8 @@ def crop_table_image(img: np.ndarray, table: Any, output_path: str) -> None:
     x1 = max(x0+1, min(x1, w))
     y1 = max(y0+1, min(y1, h))
     
-    # Crop image
-    cropped = img[y0:y1, x0:x1].copy()
+    # Crop as a view of the already-rendered page; cvtColor makes the only copy
+    cropped = img[y0:y1, x0:x1]
     
     # Convert RGB to BGR for OpenCV
     if len(cropped.shape) == 3 and cropped.shape[2] == 3:
@@ -349,29 +407,25 @@ def write_audit_log(page_data: Dict[str, Any], output_path: str) -> None:
     
     # Add figure detection stats
     if 'figures' in page_data:
-        vector_figs = sum(1 for f in page_data['figures'] if f.source == 'vector')
-        image_figs = sum(1 for f in page_data['figures'] if f.source == 'image')
-        mixed_figs = sum(1 for f in page_data['figures'] if f.source == 'mixed')
+        figure_sources = Counter(f.source for f in page_data['figures'])
         
         log_data['figure_stats'] = {
-            "vector": vector_figs,
-            "image": image_figs,
-            "mixed": mixed_figs
+            "vector": figure_sources['vector'],
+            "image": figure_sources['image'],
+            "mixed": figure_sources['mixed']
         }
     
     # Add table detection stats
     if 'tables' in page_data:
-        ruled_tables = sum(1 for t in page_data['tables'] if t.detection_method == 'ruled')
-        borderless_tables = sum(1 for t in page_data['tables'] if t.detection_method == 'borderless')
+        table_methods = Counter(t.detection_method for t in page_data['tables'])
         
         log_data['table_stats'] = {
-            "ruled": ruled_tables,
-            "borderless": borderless_tables
+            "ruled": table_methods['ruled'],
+            "borderless": table_methods['borderless']
         }
     
     # Write log file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(log_data, f, indent=2, ensure_ascii=False)
+    write_json(log_data, output_path)
 
 def create_summary_report(all_pages_data: List[Dict[str, Any]], output_path: str) -> None:
     """
@@ -421,8 +475,7 @@ def create_summary_report(all_pages_data: List[Dict[str, Any]], output_path: str
             summary["extraction_info"]["scanned_pages"] += 1
     
     # Write summary report
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    write_json(summary, output_path)
 
 def validate_outputs(outputs: Dict[str, Any]) -> bool:
     """
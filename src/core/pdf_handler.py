@@ -10,6 +10,7 @@ import logging
 # Constants - Reduced DPI for better performance
 DPI_PAGE = 150  # Reduced from 600 for faster processing
 DPI_CROP = 150  # Reduced from 600 for faster processing
+TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES  # Text extraction without image blocks
 
 def points_to_pixels(pt: float, dpi: int = DPI_PAGE) -> float:
     """Convert PDF points to pixels at given DPI"""
@@ -45,52 +46,81 @@ def render_page(page: fitz.Page, dpi: int = DPI_PAGE) -> np.ndarray:
     # Render page to pixmap
     pix = page.get_pixmap(matrix=mat, alpha=False)
     
-    # Convert to numpy array
-    # Use PNG format and then convert to RGB
-    img_data = pix.tobytes("png")
-    from PIL import Image
-    import io
-    pil_img = Image.open(io.BytesIO(img_data))
-    img = np.array(pil_img)
+    # Wrap the raw samples directly instead of encoding to PNG and decoding
+    # it again. pix.samples is the single copy: a view over samples_mv would
+    # dangle once the pixmap is freed on return. The array is read-only,
+    # which every consumer already respects (crops slice, overlays copy)
+    img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.h, pix.w, pix.n)
     
     # Ensure it's RGB
-    if len(img.shape) == 3 and img.shape[2] == 3:
-        pass  # Already RGB
-    elif len(img.shape) == 2:
+    if pix.n == 1:
         # Convert grayscale to RGB
-        img = np.stack([img, img, img], axis=2)
-    else:
-        # Convert to RGB
+        img = np.repeat(img, 3, axis=2)
+    elif pix.n > 3:
+        # Drop any extra channel
         img = img[:, :, :3]
     
     return img
 
-def load_pdf_page_data(pdf_path: str, page_num: int) -> Dict[str, Any]:
+def open_pdf(pdf_path: str) -> fitz.Document:
     """
-    Load comprehensive data from a PDF page
+    Open a PDF document, logging failures
     
     Args:
         pdf_path: Path to PDF file
-        page_num: Page number (0-indexed)
         
     Returns:
-        Dictionary containing all page data
+        Open PyMuPDF document (caller is responsible for closing it)
     """
     try:
-        doc = fitz.open(pdf_path)
+        return fitz.open(pdf_path)
     except Exception as e:
         logging.error(f"Failed to open PDF {pdf_path}: {e}")
         raise
+
+def close_pdf(doc: fitz.Document) -> None:
+    """
+    Close a PDF document and empty MuPDF's resource store
+    
+    MuPDF keeps decoded fonts/images in a process-wide store that is not
+    bounded by default, so long batch runs would otherwise keep growing
+    after every document is finished with.
+    
+    Args:
+        doc: Open PyMuPDF document
+    """
+    doc.close()
+    fitz.TOOLS.store_shrink(100)
+
+def load_pdf_page_data(pdf_path: str, page_num: int,
+                       doc: Optional[fitz.Document] = None) -> Dict[str, Any]:
+    """
+    Load comprehensive data from a PDF page
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_num: Page number (0-indexed)
+        doc: Already-open document to read from; when omitted the PDF is
+            opened and closed for this page only
+        
+    Returns:
+        Dictionary containing all page data
+    """
+    owns_doc = doc is None
+    if owns_doc:
+        doc = open_pdf(pdf_path)
     
     try:
         page = doc[page_num]
     except IndexError:
         logging.error(f"Page {page_num} not found in PDF {pdf_path}")
-        doc.close()
+        if owns_doc:
+            doc.close()
         raise
     except Exception as e:
         logging.error(f"Error accessing page {page_num} in PDF {pdf_path}: {e}")
-        doc.close()
+        if owns_doc:
+            doc.close()
         raise
     
     # Get page dimensions
@@ -100,15 +130,23 @@ def load_pdf_page_data(pdf_path: str, page_num: int) -> Dict[str, Any]:
     width_px = int(points_to_pixels(width_pt))
     height_px = int(points_to_pixels(height_pt))
     
-    # Extract text data with error handling
+    # Extract text data with error handling. Both views come from one text
+    # page built without image blocks: only text lines are read, and the
+    # default "dict" flags would otherwise decode every image into it
+    textpage = None
     try:
-        raw_dict = page.get_text("dict")
+        textpage = page.get_textpage(flags=TEXT_FLAGS)
+    except Exception as e:
+        logging.warning(f"Failed to build text page for page {page_num}: {e}")
+    
+    try:
+        raw_dict = page.get_text("dict", textpage=textpage, flags=TEXT_FLAGS)
     except Exception as e:
         logging.warning(f"Failed to extract text dict from page {page_num}: {e}")
         raw_dict = {"blocks": []}
     
     try:
-        words = page.get_text("words")
+        words = page.get_text("words", textpage=textpage, flags=TEXT_FLAGS)
     except Exception as e:
         logging.warning(f"Failed to extract words from page {page_num}: {e}")
         words = []
@@ -129,25 +167,15 @@ def load_pdf_page_data(pdf_path: str, page_num: int) -> Dict[str, Any]:
     # Render page image
     img_page = render_page(page)
     
-    # Heuristic for scanned page detection
-    painted_image_area = 0.0
-    if images:
-        total_image_area = 0
-        for img in images:
-            # Get image rectangle in points
-            img_rect = page.get_image_rects(img[0])[0]
-            total_image_area += img_rect.width * img_rect.height
-        painted_image_area = total_image_area / (width_pt * height_pt)
-    
-    is_scanned = (len(words) < 50) and (painted_image_area > 0.8)
-    
-    # Get image XObjects with their painted positions
+    # Get image XObjects with their painted positions (one rect lookup per image)
     xobjects = []
+    total_image_area = 0.0
     for img_index, img in enumerate(images):
         try:
             img_rects = page.get_image_rects(img[0])
             if img_rects:
                 rect = img_rects[0]
+                total_image_area += rect.width * rect.height
                 xobjects.append({
                     'index': img_index,
                     'bbox_pt': [rect.x0, rect.y0, rect.x1, rect.y1],
@@ -162,7 +190,13 @@ def load_pdf_page_data(pdf_path: str, page_num: int) -> Dict[str, Any]:
         except Exception as e:
             logging.warning(f"Failed to get image rect for image {img_index}: {e}")
     
-    doc.close()
+    # Heuristic for scanned page detection
+    painted_image_area = total_image_area / (width_pt * height_pt) if images else 0.0
+    
+    is_scanned = (len(words) < 50) and (painted_image_area > 0.8)
+    
+    if owns_doc:
+        doc.close()
     
     return {
         'page_size': {
@@ -223,9 +257,11 @@ def save_crop(img: np.ndarray, output_path: str) -> None:
     
     pil_img.save(output_path)
 
-def get_page_info(pdf_path: str) -> Dict[str, Any]:
-    """Get basic information about PDF"""
-    doc = fitz.open(pdf_path)
+def get_page_info(pdf_path: str, doc: Optional[fitz.Document] = None) -> Dict[str, Any]:
+    """Get basic information about PDF, reusing ``doc`` when already open"""
+    owns_doc = doc is None
+    if owns_doc:
+        doc = open_pdf(pdf_path)
     info = {
         'num_pages': len(doc),
         'metadata': doc.metadata,
@@ -242,5 +278,6 @@ def get_page_info(pdf_path: str) -> Dict[str, Any]:
             'height_px': int(points_to_pixels(rect.height))
         })
     
-    doc.close()
+    if owns_doc:
+        doc.close()
     return info
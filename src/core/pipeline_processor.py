@@ -5,11 +5,16 @@ import argparse
 import logging
 import os
 import sys
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import cv2
+import numpy as np
+
 # Import all modules
-from .pdf_handler import load_pdf_page_data, get_page_info
+from .pdf_handler import load_pdf_page_data, get_page_info, open_pdf, close_pdf
 from ..detection.column_detector import detect_columns
 from ..detection.text_detector import extract_text_blocks, group_lines_into_paragraphs, detect_headings
 from ..detection.figure_detector import (
@@ -17,12 +22,19 @@ from ..detection.figure_detector import (
     crop_figure_image,
     expand_figures_content_aware,
     expand_figures_away_from_text,
+    bbox_intersection_areas,
 )
 from ..detection.table_detector import extract_tables, save_table_csv
 from ..processing.caption_processor import link_captions
 from ..processing.content_organizer import assemble_sections, determine_title
 from .output_manager import write_page_outputs, create_summary_report, write_audit_log
 
+# Threads used to write page outputs in the background
+IO_WORKERS = 4
+
+# Raw page extraction only needed while a page is being processed
+PAGE_SCRATCH_KEYS = ('raw_dict', 'words', 'drawings', 'images')
+
 def filter_figures_away_from_tables(figures: List[Any], tables: List[Any]) -> List[Any]:
     """
     Filter out figures that overlap significantly with table areas
@@ -34,39 +46,24 @@ def filter_figures_away_from_tables(figures: List[Any], tables: List[Any]) -> Li
     Returns:
         Filtered list of figures
     """
-    if not tables:
+    if not tables or not figures:
         return figures
     
-    filtered_figures = []
+    fig_boxes = np.asarray([f.bbox_px for f in figures], dtype=np.float32)
+    fig_areas = (fig_boxes[:, 2] - fig_boxes[:, 0]) * (fig_boxes[:, 3] - fig_boxes[:, 1])
+    overlap = bbox_intersection_areas(fig_boxes, [t.bbox_px for t in tables])
     
-    for figure in figures:
-        fig_bbox = figure.bbox_px
-        fig_x0, fig_y0, fig_x1, fig_y1 = fig_bbox
-        
-        # Check if figure overlaps with any table
-        overlaps_with_table = False
-        for table in tables:
-            table_bbox = table.bbox_px
-            table_x0, table_y0, table_x1, table_y1 = table_bbox
-            
-            # Calculate overlap
-            overlap_x0 = max(fig_x0, table_x0)
-            overlap_y0 = max(fig_y0, table_y0)
-            overlap_x1 = min(fig_x1, table_x1)
-            overlap_y1 = min(fig_y1, table_y1)
-            
-            if overlap_x0 < overlap_x1 and overlap_y0 < overlap_y1:
-                # Calculate overlap area
-                overlap_area = (overlap_x1 - overlap_x0) * (overlap_y1 - overlap_y0)
-                fig_area = (fig_x1 - fig_x0) * (fig_y1 - fig_y0)
-                
-                # If more than 50% of figure overlaps with table, filter it out
-                if fig_area > 0 and overlap_area / fig_area > 0.5:
-                    overlaps_with_table = True
-                    logging.info(f"Filtering figure {fig_bbox} that overlaps with table {table_bbox}")
-                    break
-        
-        if not overlaps_with_table:
+    # A figure is dropped when more than 50% of its area lies inside any table
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(fig_areas[:, None] > 0, overlap / fig_areas[:, None], 0.0)
+    covered = ratio > 0.5
+    
+    filtered_figures = []
+    for figure, fig_covered in zip(figures, covered):
+        if fig_covered.any():
+            table_bbox = tables[int(np.argmax(fig_covered))].bbox_px
+            logging.info(f"Filtering figure {figure.bbox_px} that overlaps with table {table_bbox}")
+        else:
             filtered_figures.append(figure)
     
     logging.info(f"Filtered {len(figures) - len(filtered_figures)} figures that overlapped with tables")
@@ -83,7 +80,11 @@ def setup_logging(log_level: str = "INFO") -> None:
         ]
     )
 
-def process_page(pdf_path: str, page_num: int, output_dir: str) -> Dict[str, Any]:
+def process_page(pdf_path: str, page_num: int, output_dir: str,
+                 doc: Any = None, ocr: Any = None, io_pool: Any = None,
+                 pending_writes: Optional[List[Any]] = None,
+                 ocr_result: Optional[Dict[str, Any]] = None,
+                 column_pool: Any = None) -> Dict[str, Any]:
     """
     Process a single page through the complete pipeline
     
@@ -91,6 +92,15 @@ def process_page(pdf_path: str, page_num: int, output_dir: str) -> Dict[str, Any
         pdf_path: Path to PDF file
         page_num: Page number (0-indexed)
         output_dir: Output directory
+        doc: Optional already-open PyMuPDF document to reuse
+        ocr: Optional MistralOCR client shared across pages of the same PDF
+        io_pool: Optional executor for output file writes
+        pending_writes: With io_pool, receives the write futures for the caller
+            to check; without it the page waits for its own writes
+        ocr_result: Optional Mistral OCR result already fetched for this page;
+            when given, no OCR client is used
+        column_pool: Optional single-thread executor that detects columns
+            while text blocks are built; without it columns are detected inline
         
     Returns:
         Dictionary containing page data and outputs
@@ -102,13 +112,20 @@ def process_page(pdf_path: str, page_num: int, output_dir: str) -> Dict[str, Any
     
     # Step A: Load & Preflight
     print("  ⏳ Loading PDF data...")
-    page_data = load_pdf_page_data(pdf_path, page_num)
+    page_data = load_pdf_page_data(pdf_path, page_num, doc=doc)
     page_data['page_num'] = page_num
     
+    # Grayscale once for every image-based step (columns, figure expansion)
+    gray_page = cv2.cvtColor(page_data['img_page'], cv2.COLOR_RGB2GRAY)
+    
     # Step B: Column Detection
+    # With a column_pool this runs on its helper thread while text blocks are
+    # built: OpenCV releases the GIL on the page image, and the text pass only
+    # needs the raw dict
     print("  ⏳ Detecting columns...")
-    columns = detect_columns(page_data['img_page'])
-    page_data['columns'] = columns
+    columns_future = None
+    if column_pool is not None:
+        columns_future = column_pool.submit(detect_columns, gray_page)
     
     # Step C: Text Blocks
     print("  ⏳ Extracting text...")
@@ -116,6 +133,12 @@ def process_page(pdf_path: str, page_num: int, output_dir: str) -> Dict[str, Any
     text_blocks = group_lines_into_paragraphs(text_blocks)
     text_blocks = detect_headings(text_blocks)
     
+    if columns_future is not None:
+        columns = columns_future.result()
+    else:
+        columns = detect_columns(gray_page)
+    page_data['columns'] = columns
+    
     # Filter text blocks to columns
     from ..detection.text_detector import filter_blocks_in_columns
     text_blocks = filter_blocks_in_columns(text_blocks, columns)
@@ -125,9 +148,13 @@ def process_page(pdf_path: str, page_num: int, output_dir: str) -> Dict[str, Any
     print("  ⏳ Extracting content with Mistral OCR...")
     
     try:
-        from ..extraction.mistral_service import MistralOCR
-        mistral_ocr = MistralOCR()
-        mistral_result = mistral_ocr.process_pdf_page(pdf_path, page_num + 1)
+        mistral_result = ocr_result
+        if mistral_result is None:
+            mistral_ocr = ocr
+            if mistral_ocr is None:
+                from ..extraction.mistral_service import get_mistral_ocr
+                mistral_ocr = get_mistral_ocr()
+            mistral_result = mistral_ocr.process_pdf_page(pdf_path, page_num + 1)
         
         mistral_tables = mistral_result.get("tables", [])
         mistral_text_blocks = mistral_result.get("text_blocks", [])
@@ -186,7 +213,7 @@ def process_page(pdf_path: str, page_num: int, output_dir: str) -> Dict[str, Any
     # Content-aware expand to prevent tight crops, avoiding text regions
     try:
         # First try edge-based growth, then whitespace-to-text growth for robustness
-        expand_figures_content_aware(page_data['img_page'], figures, text_blocks)
+        expand_figures_content_aware(gray_page, figures, text_blocks)
         expand_figures_away_from_text(figures, text_blocks, page_data['page_size'])
     except Exception as e:
         logging.warning(f"Figure expansion skipped: {e}")
@@ -207,14 +234,21 @@ def process_page(pdf_path: str, page_num: int, output_dir: str) -> Dict[str, Any
     
     # Step I: Exports
     print("  ⏳ Writing outputs...")
-    outputs = write_page_outputs(page_num, page_data, output_dir, debug=False)
+    outputs = write_page_outputs(page_num, page_data, output_dir, debug=False,
+                                 io_pool=io_pool, pending_writes=pending_writes)
     page_data['outputs'] = outputs
     
+    # Drop the raw PyMuPDF extraction now that the page has been analysed, so
+    # multi-page runs don't keep every page's parse results alive
+    for key in PAGE_SCRATCH_KEYS:
+        page_data.pop(key, None)
+    
     elapsed = time.time() - start_time
     print(f"  ✅ Completed page {page_num + 1} in {elapsed:.1f}s")
     return page_data
 
-def process_pdf(pdf_path: str, output_dir: str, pages: List[int] = None) -> Dict[str, Any]:
+def process_pdf(pdf_path: str, output_dir: str, pages: List[int] = None,
+                doc: Any = None) -> Dict[str, Any]:
     """
     Process a PDF file through the complete pipeline
     
@@ -222,30 +256,200 @@ def process_pdf(pdf_path: str, output_dir: str, pages: List[int] = None) -> Dict
         pdf_path: Path to PDF file
         output_dir: Output directory
         pages: List of page numbers to process (None for all pages)
+        doc: Optional already-open PyMuPDF document; left open for the caller
         
     Returns:
         Dictionary containing all page data
     """
     logging.info(f"Processing PDF: {pdf_path}")
     
+    # Open the document once and share it between the info pass and every page
+    owns_doc = doc is None
+    if owns_doc:
+        doc = open_pdf(pdf_path)
+    
+    try:
+        return _process_open_pdf(pdf_path, output_dir, pages, doc)
+    finally:
+        if owns_doc:
+            close_pdf(doc)
+
+def _process_open_pdf(pdf_path: str, output_dir: str, pages: Optional[List[int]],
+                      doc: Any) -> Dict[str, Any]:
+    """Run the pipeline over the requested pages of an already-open document"""
     # Get PDF info
-    pdf_info = get_page_info(pdf_path)
+    pdf_info = get_page_info(pdf_path, doc=doc)
     total_pages = pdf_info['num_pages']
     
     if pages is None:
         pages = list(range(total_pages))
+    else:
+        # Visit each requested page once, in document order, so the shared
+        # document and OCR response are walked front to back
+        pages = sorted(set(pages))
     
     logging.info(f"Processing {len(pages)} pages out of {total_pages}")
     
-    # Process each page
+    # One OCR client for the whole run so the document is only sent once
+    ocr = None
+    try:
+        from ..extraction.mistral_service import get_mistral_ocr
+        ocr = get_mistral_ocr()
+    except Exception as e:
+        logging.warning(f"Mistral OCR unavailable: {e}")
+    
+    # Process each page; file writes overlap with the next page's analysis and
+    # leaving the pool's context waits for all of them to finish. One helper
+    # thread serves column detection for every page of the run
+    processed = []  # (page_num, page_data, write futures)
+    try:
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as io_pool, \
+                ThreadPoolExecutor(max_workers=1) as column_pool:
+            for page_num in pages:
+                writes = []
+                try:
+                    page_data = process_page(pdf_path, page_num, output_dir,
+                                             doc=doc, ocr=ocr, io_pool=io_pool,
+                                             pending_writes=writes,
+                                             column_pool=column_pool)
+                    processed.append((page_num, page_data, writes))
+                except Exception as e:
+                    logging.error(f"Error processing page {page_num + 1}: {e}")
+                    continue
+    finally:
+        # The OCR client outlives this PDF; don't keep its whole-document response
+        if ocr is not None:
+            ocr.release_document(pdf_path)
+    
+    # A page only counts as processed once all of its files were written
     all_pages_data = []
-    for page_num in pages:
+    for page_num, page_data, writes in processed:
         try:
-            page_data = process_page(pdf_path, page_num, output_dir)
-            all_pages_data.append(page_data)
+            for future in writes:
+                future.result()
         except Exception as e:
-            logging.error(f"Error processing page {page_num + 1}: {e}")
+            logging.error(f"Error writing outputs for page {page_num + 1}: {e}")
             continue
+        all_pages_data.append(page_data)
+    
+    # Create summary report
+    summary_path = os.path.join(output_dir, "summary.json")
+    create_summary_report(all_pages_data, summary_path)
+    
+    logging.info(f"Completed processing {len(all_pages_data)} pages")
+    return {
+        'pdf_info': pdf_info,
+        'pages': all_pages_data,
+        'summary_path': summary_path
+    }
+
+# Per-process document handle for process_pdf_parallel workers
+_worker_doc = None
+
+def limit_worker_threads() -> None:
+    """Keep OpenCV single-threaded in a worker process so N workers don't oversubscribe the CPUs"""
+    cv2.setNumThreads(1)
+
+def _init_page_worker(pdf_path: str) -> None:
+    """Open the PDF once when a worker process starts"""
+    global _worker_doc
+    limit_worker_threads()
+    _worker_doc = open_pdf(pdf_path)
+    # Close it (and empty MuPDF's store) when the worker exits. atexit hooks
+    # don't run in forked pool workers; multiprocessing finalizers do
+    Finalize(None, close_pdf, args=(_worker_doc,), exitpriority=10)
+
+def _process_page_in_worker(pdf_path: str, page_num: int, output_dir: str,
+                            ocr_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Run process_page against the worker's already-open document"""
+    page_data = process_page(pdf_path, page_num, output_dir, doc=_worker_doc,
+                             ocr_result=ocr_result)
+    # The rendered page is already saved as page_XX.png; don't pickle the
+    # full array back to the parent for every page
+    page_data.pop('img_page', None)
+    return page_data
+
+def _fetch_ocr_results(pdf_path: str, pages: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Run Mistral OCR over the document once and split the result per page
+    
+    Args:
+        pdf_path: Path to PDF file
+        pages: Page numbers (0-indexed) to return results for
+        
+    Returns:
+        Per-page OCR results keyed by page number; pages get an empty result
+        when OCR is unavailable
+    """
+    try:
+        from ..extraction.mistral_service import get_mistral_ocr
+        ocr = get_mistral_ocr()
+    except Exception as e:
+        logging.warning(f"Mistral OCR unavailable: {e}")
+        return {page_num: {"tables": [], "text_blocks": []} for page_num in pages}
+    
+    try:
+        return {page_num: ocr.process_pdf_page(pdf_path, page_num + 1) for page_num in pages}
+    finally:
+        # The per-page results are all that's needed from here on
+        ocr.release_document(pdf_path)
+
+def process_pdf_parallel(pdf_path: str, output_dir: str, pages: List[int] = None,
+                         workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Process a PDF file with its pages distributed across worker processes
+    
+    Pages are independent once the document is opened, so each worker opens
+    the PDF itself once at startup (PyMuPDF documents cannot be pickled) and
+    runs process_page on every page it is given against that handle, with
+    column detection inline rather than on an extra thread. Mistral
+    OCR covers the whole document in one request, so it is run once here and
+    each worker only receives its page's result. Returned pages don't carry
+    the rendered img_page array; it is saved as page_XX.png.
+    
+    Args:
+        pdf_path: Path to PDF file
+        output_dir: Output directory
+        pages: List of page numbers to process (None for all pages)
+        workers: Number of worker processes (None for one per CPU)
+        
+    Returns:
+        Dictionary containing all page data, ordered by page number
+    """
+    logging.info(f"Processing PDF in parallel: {pdf_path}")
+    
+    # Get PDF info
+    pdf_info = get_page_info(pdf_path)
+    total_pages = pdf_info['num_pages']
+    
+    if pages is None:
+        pages = list(range(total_pages))
+    else:
+        pages = sorted(set(pages))
+    
+    logging.info(f"Processing {len(pages)} pages out of {total_pages} with {workers or os.cpu_count()} workers")
+    
+    ocr_results = _fetch_ocr_results(pdf_path, pages)
+    
+    # Dispatch one job per page and gather results as they finish
+    all_pages_data = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_page_worker,
+                             initargs=(pdf_path,)) as executor:
+        futures = {
+            executor.submit(_process_page_in_worker, pdf_path, page_num, output_dir,
+                            ocr_results[page_num]): page_num
+            for page_num in pages
+        }
+        for future in as_completed(futures):
+            page_num = futures[future]
+            try:
+                all_pages_data.append(future.result())
+            except Exception as e:
+                logging.error(f"Error processing page {page_num + 1}: {e}")
+                continue
+    
+    # Restore document order regardless of completion order
+    all_pages_data.sort(key=lambda p: p['page_num'])
     
     # Create summary report
     summary_path = os.path.join(output_dir, "summary.json")
@@ -280,6 +484,12 @@ def main():
         help="Comma-separated list of page numbers to process (1-indexed, e.g., '1,3,5-7')"
     )
     
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for page-level parallelism (default: 1)"
+    )
     
     parser.add_argument(
         "--log-level",
@@ -311,7 +521,10 @@ def main():
     
     try:
         # Process PDF
-        result = process_pdf(args.pdf_path, args.output, pages)
+        if args.workers > 1:
+            result = process_pdf_parallel(args.pdf_path, args.output, pages, args.workers)
+        else:
+            result = process_pdf(args.pdf_path, args.output, pages)
         
         # Print summary
         print(f"\nProcessing complete!")
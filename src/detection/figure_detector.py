@@ -3,7 +3,6 @@ Figure detection using vector clustering and image XObjects
 """
 import numpy as np
 import cv2
-from sklearn.cluster import DBSCAN
 from typing import List, Dict, Any, Tuple, Optional
 import logging
 
@@ -18,6 +17,10 @@ TEXT_RATIO_THRESHOLD = 0.25  # If >25% text, try to refine boundaries
 FIGURE_REJECTION_THRESHOLD = 0.5  # If >50% text, reject figure entirely
 MIN_FIGURE_AREA = 0.3  # Minimum 30% of original area after text filtering
 
+# Structuring elements for content-aware expansion, built once
+_EXPAND_DILATE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+_EXPAND_ERODE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
 class Figure:
     """Represents a detected figure"""
     def __init__(self, bbox_px: List[int], source: str, stroke_length: float = 0):
@@ -111,33 +114,16 @@ def detect_vector_figures(drawings: List[Dict], columns: List[Tuple[int, int]])
     if not drawings:
         return []
     
+    # Convert every stroke/fill rect to pixels once; both the page analysis and
+    # the box filtering below work from this list
+    all_boxes = collect_drawing_boxes(drawings)
+    
     # Step 1: Analyze page content to determine adaptive parameters
-    page_analysis = analyze_page_content(drawings)
+    page_analysis = analyze_page_content(drawings, drawing_boxes=all_boxes)
     logging.info(f"Page analysis: {page_analysis}")
     
     # Step 2: Collect drawing bounding boxes with adaptive filtering
-    drawing_boxes = []
-    
-    for drawing in drawings:
-        if drawing.get("type") in ["s", "f"]:  # Only stroke and fill types exist in PyMuPDF
-            rect = drawing.get("rect")
-            if rect:
-                # Convert to pixels
-                x0 = int(rect.x0 * (150/72))
-                y0 = int(rect.y0 * (150/72))
-                x1 = int(rect.x1 * (150/72))
-                y1 = int(rect.y1 * (150/72))
-                
-                # Calculate area
-                area = (x1 - x0) * (y1 - y0)
-                
-                # Use adaptive threshold based on page analysis
-                if area > page_analysis['min_drawing_area']:
-                    drawing_boxes.append({
-                        'bbox': [x0, y0, x1, y1],
-                        'area': area,
-                        'drawing': drawing
-                    })
+    drawing_boxes = [box for box in all_boxes if box['area'] > page_analysis['min_drawing_area']]
     
     if not drawing_boxes:
         return []
@@ -147,12 +133,44 @@ def detect_vector_figures(drawings: List[Dict], columns: List[Tuple[int, int]])
     
     return figures
 
-def analyze_page_content(drawings: List[Dict]) -> Dict[str, Any]:
+def collect_drawing_boxes(drawings: List[Dict]) -> List[Dict]:
+    """
+    Convert stroke/fill drawing rects to pixel boxes
+    
+    Args:
+        drawings: List of drawing operations
+        
+    Returns:
+        List of dicts with 'bbox' ([x0, y0, x1, y1] px), 'area' and 'drawing'
+    """
+    # Only stroke and fill types exist in PyMuPDF
+    selected = [d for d in drawings if d.get("type") in ["s", "f"] and d.get("rect")]
+    if not selected:
+        return []
+    
+    # Gather all rects first, then convert to pixels in one shot (astype
+    # truncates toward zero, matching the int() conversion elsewhere). int64
+    # holds PyMuPDF's infinite rect (+-2**31 pt) in pixels; its area doesn't
+    # fit in int64, so the product is taken on Python ints
+    rects_pt = np.array([[d["rect"].x0, d["rect"].y0, d["rect"].x1, d["rect"].y1] for d in selected],
+                        dtype=np.float64)
+    rects_px = (rects_pt * (150/72)).astype(np.int64)
+    widths = (rects_px[:, 2] - rects_px[:, 0]).tolist()
+    heights = (rects_px[:, 3] - rects_px[:, 1]).tolist()
+    
+    return [
+        {'bbox': bbox, 'area': w * h, 'drawing': drawing}
+        for bbox, w, h, drawing in zip(rects_px.tolist(), widths, heights, selected)
+    ]
+
+def analyze_page_content(drawings: List[Dict], drawing_boxes: Optional[List[Dict]] = None) -> Dict[str, Any]:
     """
     Analyze page content to determine adaptive parameters
     
     Args:
         drawings: List of drawing operations
+        drawing_boxes: Boxes already produced by collect_drawing_boxes(drawings),
+            to avoid converting the drawings a second time
         
     Returns:
         Dictionary with adaptive parameters
@@ -166,29 +184,15 @@ def analyze_page_content(drawings: List[Dict]) -> Dict[str, Any]:
             'content_type': 'unknown'
         }
     
-    # Collect all drawing areas
-    areas = []
-    aspect_ratios = []
-    
-    for drawing in drawings:
-        if drawing.get("type") in ["s", "f"]:
-            rect = drawing.get("rect")
-            if rect:
-                x0 = int(rect.x0 * (150/72))
-                y0 = int(rect.y0 * (150/72))
-                x1 = int(rect.x1 * (150/72))
-                y1 = int(rect.y1 * (150/72))
-                
-                area = (x1 - x0) * (y1 - y0)
-                width = x1 - x0
-                height = y1 - y0
-                aspect_ratio = width / height if height > 0 else 0
-                
-                if area > 100:  # Only consider meaningful drawings
-                    areas.append(area)
-                    aspect_ratios.append(aspect_ratio)
+    if drawing_boxes is None:
+        drawing_boxes = collect_drawing_boxes(drawings)
     
-    if not areas:
+    # Collect all drawing areas straight into one preallocated array
+    areas = np.fromiter((box['area'] for box in drawing_boxes),
+                        dtype=np.float64, count=len(drawing_boxes))
+    areas = areas[areas > 100]  # Only consider meaningful drawings
+    
+    if areas.size == 0:
         return {
             'min_drawing_area': 2000,
             'merge_distance': 100,
@@ -198,12 +202,7 @@ def analyze_page_content(drawings: List[Dict]) -> Dict[str, Any]:
         }
     
     # Calculate statistics
-    areas = np.array(areas)
-    aspect_ratios = np.array(aspect_ratios)
-    
     median_area = np.median(areas)
-    mean_area = np.mean(areas)
-    std_area = np.std(areas)
     
     # Determine content type based on drawing characteristics
     if median_area > 50000:
@@ -660,61 +659,66 @@ def detect_image_figures(xobjects: List[Dict], columns: List[Tuple[int, int]], p
     min_dim = int(max(70, 0.06 * page_w))        # pixels
     min_area = int(max(8000, 0.004 * page_area)) # pixels^2
 
-    for xobj in xobjects:
-        bbox_px = xobj['bbox_px']
-        
-        # More lenient column checking - just check if image overlaps with any column
-        image_center_x = (bbox_px[0] + bbox_px[2]) / 2
-        image_center_y = (bbox_px[1] + bbox_px[3]) / 2
-        
-        in_column = False
-        for x0, x1 in columns:
-            # Check if image center is within column OR if image overlaps column
-            if (x0 <= image_center_x < x1) or (bbox_px[0] < x1 and bbox_px[2] > x0):
-                in_column = True
-                break
-        
+    if not xobjects:
+        return figures
+
+    # Geometry for every image at once as (N,) columns of one (N, 4) array
+    boxes = np.array([xobj['bbox_px'] for xobj in xobjects], dtype=np.int64).reshape(-1, 4)
+    bx0, by0, bx1, by1 = boxes.T
+
+    # More lenient column checking - just check if image overlaps with any column:
+    # image center within a column OR image overlapping it
+    if columns:
+        cols = np.asarray(columns, dtype=np.float64).reshape(-1, 2)
+        col_x0, col_x1 = cols[:, 0], cols[:, 1]
+        center_x = ((bx0 + bx1) / 2)[:, None]
+        in_column = (((col_x0 <= center_x) & (center_x < col_x1)) |
+                     ((bx0[:, None] < col_x1) & (bx1[:, None] > col_x0))).any(axis=1)
+    else:
         # If no columns detected, accept all images
-        if not columns:
-            in_column = True
-        
-        if in_column:
-            # Size-based filtering to avoid icons and small warning symbols
-            w = max(1, bbox_px[2] - bbox_px[0])
-            h = max(1, bbox_px[3] - bbox_px[1])
-            area = w * h
+        in_column = np.ones(len(boxes), dtype=bool)
 
-            # Extremely elongated and thin -> likely rule/line strip
-            aspect = w / h if h > 0 else 0
+    # Size-based filtering to avoid icons and small warning symbols
+    w = np.maximum(1, bx1 - bx0)
+    h = np.maximum(1, by1 - by0)
+    area = w * h
 
-            is_too_small = (w < min_dim) or (h < min_dim) or (area < min_area)
-            is_strip = (aspect > 8.0 and h < 50) or (aspect < 0.125 and w < 50)
+    # Extremely elongated and thin -> likely rule/line strip
+    aspect = w / h
 
-            # Near-square tiny images are typical icons/logos
-            is_small_square_icon = abs(w - h) <= 0.2 * max(w, h) and max(w, h) < (min_dim + 10)
+    is_too_small = (w < min_dim) | (h < min_dim) | (area < min_area)
+    is_strip = ((aspect > 8.0) & (h < 50)) | ((aspect < 0.125) & (w < 50))
 
-            if is_too_small or is_strip or is_small_square_icon:
-                logging.info(
-                    f"Skipping small/strip/icon image {bbox_px} (w={w}, h={h}, area={area})"
-                )
-                continue
+    # Near-square tiny images are typical icons/logos
+    longest = np.maximum(w, h)
+    is_small_square_icon = (np.abs(w - h) <= 0.2 * longest) & (longest < (min_dim + 10))
 
-            # Add modest padding for image figures
-            padding = 8
-            padded_bbox = [
-                max(0, bbox_px[0] - padding),
-                max(0, bbox_px[1] - padding),
-                bbox_px[2] + padding,
-                bbox_px[3] + padding
-            ]
+    rejected = is_too_small | is_strip | is_small_square_icon
 
-            figure = Figure(
-                bbox_px=padded_bbox,
-                source='image',
-                stroke_length=0
+    for i in np.flatnonzero(in_column):
+        bbox_px = xobjects[i]['bbox_px']
+        if rejected[i]:
+            logging.info(
+                f"Skipping small/strip/icon image {bbox_px} (w={w[i]}, h={h[i]}, area={area[i]})"
             )
-            figures.append(figure)
-            logging.info(f"Detected image figure: {padded_bbox}")
+            continue
+
+        # Add modest padding for image figures
+        padding = 8
+        padded_bbox = [
+            max(0, bbox_px[0] - padding),
+            max(0, bbox_px[1] - padding),
+            bbox_px[2] + padding,
+            bbox_px[3] + padding
+        ]
+
+        figure = Figure(
+            bbox_px=padded_bbox,
+            source='image',
+            stroke_length=0
+        )
+        figures.append(figure)
+        logging.info(f"Detected image figure: {padded_bbox}")
     
     return figures
 
@@ -731,8 +735,13 @@ def merge_figures(figures: List[Figure]) -> List[Figure]:
     if not figures:
         return []
     
-    # Sort by area (largest first)
-    figures = sorted(figures, key=lambda f: f.area, reverse=True)
+    # Work on a (N, 4) bbox array: sort by area (largest first, stable for ties)
+    # and compute every pairwise IoU up front instead of per pair in the loop
+    boxes = np.array([f.bbox_px for f in figures], dtype=np.float32).reshape(-1, 4)
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    order = np.argsort(-areas, kind='stable')
+    figures = [figures[k] for k in order]
+    suppress = bbox_iou_matrix(boxes[order]) > NMS_IOU
     
     merged = []
     used = set()
@@ -743,13 +752,13 @@ def merge_figures(figures: List[Figure]) -> List[Figure]:
         
         # Find overlapping figures
         overlapping = [i]
-        for j in range(i+1, len(figures)):
+        for j in np.flatnonzero(suppress[i, i+1:]) + i + 1:
+            j = int(j)
             if j in used:
                 continue
             
-            if calculate_iou(figure, figures[j]) > NMS_IOU:
-                overlapping.append(j)
-                used.add(j)
+            overlapping.append(j)
+            used.add(j)
         
         if len(overlapping) == 1:
             # No overlaps, keep original
@@ -813,15 +822,13 @@ def merge_overlapping_figures(figures: List[Figure]) -> Figure:
         return figures[0]
     
     # Calculate combined bounding box - but be more conservative
-    x0 = min(f.bbox_px[0] for f in figures)
-    y0 = min(f.bbox_px[1] for f in figures)
-    x1 = max(f.bbox_px[2] for f in figures)
-    y1 = max(f.bbox_px[3] for f in figures)
+    boxes = np.array([f.bbox_px for f in figures], dtype=np.int64)
+    x0, y0 = (int(v) for v in boxes[:, :2].min(axis=0))
+    x1, y1 = (int(v) for v in boxes[:, 2:].max(axis=0))
     
     # Apply conservative boundary constraints to avoid including too much text
     # Limit expansion to reasonable bounds based on individual figure sizes
-    avg_width = sum(f.bbox_px[2] - f.bbox_px[0] for f in figures) / len(figures)
-    avg_height = sum(f.bbox_px[3] - f.bbox_px[1] for f in figures) / len(figures)
+    avg_width, avg_height = (boxes[:, 2:] - boxes[:, :2]).mean(axis=0)
     
     # Don't let the merged figure be more than 3x the average size in any dimension
     max_width = avg_width * 3
@@ -882,6 +889,44 @@ def _bbox_iou(a: List[int], b: List[int]) -> float:
     ua = (ax1-ax0)*(ay1-ay0) + (bx1-bx0)*(by1-by0) - ia
     return ia/ua if ua > 0 else 0.0
 
+def bbox_intersection_areas(boxes_a: List[List[int]], boxes_b: List[List[int]]) -> np.ndarray:
+    """
+    Compute pairwise intersection areas between two sets of boxes
+    
+    Args:
+        boxes_a: N boxes as [x0, y0, x1, y1]
+        boxes_b: M boxes as [x0, y0, x1, y1]
+        
+    Returns:
+        (N, M) float32 array of intersection areas (0 where boxes are disjoint)
+    """
+    a = np.asarray(boxes_a, dtype=np.float32).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float32).reshape(-1, 4)
+    
+    iw = np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0])
+    ih = np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1])
+    
+    return np.clip(iw, 0, None) * np.clip(ih, 0, None)
+
+def bbox_iou_matrix(boxes: np.ndarray) -> np.ndarray:
+    """
+    Compute the pairwise IoU matrix for one set of boxes
+    
+    Args:
+        boxes: (N, 4) array of [x0, y0, x1, y1]
+        
+    Returns:
+        (N, N) float32 IoU matrix (0 where boxes are disjoint)
+    """
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    inter = bbox_intersection_areas(boxes, boxes)
+    union = areas[:, None] + areas[None, :] - inter
+    
+    iou = np.zeros_like(inter)
+    np.divide(inter, union, out=iou, where=(inter > 0) & (union > 0))
+    return iou
+
 def refine_figures(figures: List[Figure], page_size: Dict[str, Any]) -> List[Figure]:
     """
     Reduce fragmentation via proximity merge, containment pruning, and filters.
@@ -984,30 +1029,23 @@ def filter_text_from_figures(figures: List[Figure], text_blocks: List[Any]) -> L
     if not figures or not text_blocks:
         return figures
     
+    boxed_blocks = [tb for tb in text_blocks if hasattr(tb, 'bbox_px')]
+    if boxed_blocks:
+        overlap = bbox_intersection_areas([f.bbox_px for f in figures],
+                                          [tb.bbox_px for tb in boxed_blocks])
+    else:
+        overlap = np.zeros((len(figures), 0), dtype=np.float32)
+    
     filtered_figures = []
     
-    for figure in figures:
+    for fig_idx, figure in enumerate(figures):
         fig_x0, fig_y0, fig_x1, fig_y1 = figure.bbox_px
         fig_area = (fig_x1 - fig_x0) * (fig_y1 - fig_y0)
         
-        # Find text blocks that overlap significantly with this figure
-        overlapping_text_area = 0
-        text_blocks_in_figure = []
-        
-        for text_block in text_blocks:
-            if hasattr(text_block, 'bbox_px'):
-                tb_x0, tb_y0, tb_x1, tb_y1 = text_block.bbox_px
-                
-                # Calculate overlap
-                overlap_x0 = max(fig_x0, tb_x0)
-                overlap_y0 = max(fig_y0, tb_y0)
-                overlap_x1 = min(fig_x1, tb_x1)
-                overlap_y1 = min(fig_y1, tb_y1)
-                
-                if overlap_x0 < overlap_x1 and overlap_y0 < overlap_y1:
-                    overlap_area = (overlap_x1 - overlap_x0) * (overlap_y1 - overlap_y0)
-                    overlapping_text_area += overlap_area
-                    text_blocks_in_figure.append(text_block)
+        # Text blocks that overlap this figure, and the total overlapped area
+        row = overlap[fig_idx]
+        overlapping_text_area = float(row.sum())
+        text_blocks_in_figure = [boxed_blocks[j] for j in np.flatnonzero(row > 0)]
         
         # If more than threshold of the figure area is text, try to shrink the boundary
         text_ratio = overlapping_text_area / fig_area if fig_area > 0 else 0
@@ -1131,14 +1169,16 @@ def detect_figures_fallback(img: np.ndarray, columns: List[Tuple[int, int]]) ->
     if len(img.shape) == 3:
         gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
     else:
-        gray = img.copy()
+        # Already single-channel and only read from here on, so no copy
+        gray = img
     
     h, w = gray.shape
     
     # Create binary image by removing text
     # Use horizontal erosion to remove text lines
-    kernel_h = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 3))
-    eroded = cv2.erode(gray, kernel_h, iterations=2)
+    # (two passes of a 1x3 erosion == one pass of a 1x5 erosion)
+    kernel_h = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 5))
+    eroded = cv2.erode(gray, kernel_h)
     
     # Find connected components
     _, labels, stats, centroids = cv2.connectedComponentsWithStats(eroded, connectivity=8)
@@ -1188,7 +1228,7 @@ def expand_figures_content_aware(img: np.ndarray, figures: List[Figure],
     avoiding expansion into nearby text blocks. Operates in-place.
     
     Args:
-        img: Full page RGB image
+        img: Full page RGB or grayscale image
         figures: List of detected Figure objects
         text_blocks: Text blocks to avoid when expanding
         max_expand: Maximum pixels to search outward on each side
@@ -1244,15 +1284,26 @@ def expand_figures_content_aware(img: np.ndarray, figures: List[Figure],
                     edges[max(0, ey0):min(edges.shape[0], ey1),
                           max(0, ex0):min(edges.shape[1], ex1)] = 0
 
-        # Connect nearby edges and fill thin gaps
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        edges = cv2.dilate(edges, kernel, iterations=1)
-        edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel, iterations=1)
+        # Nothing left to grow into; skip the morphology and contour passes
+        if cv2.countNonZero(edges) == 0:
+            continue
+
+        # Connect nearby edges and fill thin gaps: a 3x3 dilate followed by a
+        # 3x3 close is one 5x5 dilate and one 3x3 erode
+        edges = cv2.dilate(edges, _EXPAND_DILATE_KERNEL)
+        edges = cv2.erode(edges, _EXPAND_ERODE_KERNEL)
 
-        # Find contours; keep those touching the original bbox region
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        if not contours:
+        # Edge components and their boxes in one pass; an 8-connected
+        # component's box is the bounding rect of its external contour, so
+        # this replaces findContours + boundingRect per contour
+        n_labels, _, stats, _ = cv2.connectedComponentsWithStats(edges, connectivity=8)
+        if n_labels <= 1:
             continue
+        comp = stats[1:]  # Skip background (label 0)
+        cx = comp[:, cv2.CC_STAT_LEFT]
+        cy = comp[:, cv2.CC_STAT_TOP]
+        cx1 = cx + comp[:, cv2.CC_STAT_WIDTH]
+        cy1 = cy + comp[:, cv2.CC_STAT_HEIGHT]
 
         # Original bbox in ROI coordinates
         bx0 = x0 - roi_x0
@@ -1260,21 +1311,15 @@ def expand_figures_content_aware(img: np.ndarray, figures: List[Figure],
         bx1 = x1 - roi_x1 + (roi_x1 - roi_x0)
         by1 = y1 - roi_y1 + (roi_y1 - roi_y0)
 
+        # Keep components overlapping the current bbox region (in ROI coords)
+        touching = ((np.maximum(bx0, cx) < np.minimum(bx1, cx1)) &
+                    (np.maximum(by0, cy) < np.minimum(by1, cy1)))
         sel_x0, sel_y0, sel_x1, sel_y1 = bx0, by0, bx1, by1
-        for cnt in contours:
-            cx, cy, cw, ch = cv2.boundingRect(cnt)
-            cx1 = cx + cw
-            cy1 = cy + ch
-            # Overlap test with current bbox region (in ROI coords)
-            ox0 = max(bx0, cx)
-            oy0 = max(by0, cy)
-            ox1 = min(bx1, cx1)
-            oy1 = min(by1, cy1)
-            if ox0 < ox1 and oy0 < oy1:
-                sel_x0 = min(sel_x0, cx)
-                sel_y0 = min(sel_y0, cy)
-                sel_x1 = max(sel_x1, cx1)
-                sel_y1 = max(sel_y1, cy1)
+        if touching.any():
+            sel_x0 = min(sel_x0, int(cx[touching].min()))
+            sel_y0 = min(sel_y0, int(cy[touching].min()))
+            sel_x1 = max(sel_x1, int(cx1[touching].max()))
+            sel_y1 = max(sel_y1, int(cy1[touching].max()))
 
         # Map back to page coordinates
         new_x0 = max(0, roi_x0 + sel_x0)
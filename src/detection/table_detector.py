@@ -1,6 +1,7 @@
 """
 Table detection using ruled and borderless table detection
 """
+import re
 import numpy as np
 import cv2
 from typing import List, Dict, Any, Tuple, Optional
@@ -21,6 +22,47 @@ MIN_BLOCKS_PER_ROW = 2  # Minimum blocks needed for a table row - very lenient
 MIN_STRUCTURED_PATTERNS = 1  # Minimum structured patterns needed - very lenient
 MIN_TABLE_KEYWORDS = 1  # Minimum table keywords needed - very lenient
 
+# Text cues for borderless table rows and technical drawing labels
+STRUCTURED_PATTERNS = [
+    r'^[A-Z]{2,}\d+$',  # Codes like "VQFN32", "RSM32"
+    r'^\d+$',  # Pure numbers
+    r'^[A-Za-z]+-[A-Za-z]+$',  # Hyphenated codes like "Level-1"
+    r'^\d+-\d+$',  # Number ranges like "3000-250"
+    r'^[A-Z]{3,}\d+[A-Z]*$',  # Part numbers like "TPS51633RSMR"
+    r'^\([0-9]+\)$',  # Numbered items like "(1)", "(2)"
+]
+
+TABLE_KEYWORDS = [
+    'status', 'material', 'package', 'qty', 'rohs', 'lead', 'msl', 'temp',
+    'part', 'number', 'type', 'pins', 'carrier', 'finish', 'rating', 'reflow',
+    'active', 'production', 'vqfn', 'rsm', 'nipdau', 'level-1', 'unlimited',
+    'orderable', 'ball', 'peak', 'op', 'marking', 'addendum', 'information'
+]
+
+TECH_DRAWING_KEYWORDS = [
+    'stencil', 'design', 'vqfn', 'quad', 'flatpack', 'lead', 'metal',
+    'laser', 'cutting', 'apertures', 'trapezoidal', 'rounded', 'corners',
+    'ipc-7525', 'texas', 'instruments', 'example', 'based', 'thick',
+    'printed', 'scale', 'continued', 'notes', 'symm', 'typ', 'max',
+    'height', 'width', 'diameter', 'radius', 'exposed', 'pad', 'solder',
+    'paste', 'coverage', 'area', 'package', 'mm', 'dimensions'
+]
+
+DIMENSION_PATTERNS = [
+    r'\(\d+\.?\d*\)',  # (0.715), (1.23), etc.
+    r'\(\d+\.?\d*\s*[A-Za-z]+\)',  # (R0.05) TYP, etc.
+    r'\d+X\s*\(\d+\.?\d*\)',  # 32X (0.55), 4X (1.23), etc.
+    r'^\d+\.\d+$',  # Pure decimal numbers like "0.715"
+    r'^[A-Z]\d+[A-Z]*\d*$',  # Part numbers like "RSM0032B"
+]
+
+# Each cue list is compiled into one alternation so a text is scanned once
+# per list instead of once per pattern/keyword
+_STRUCTURED_RE = re.compile("|".join(f"(?:{p})" for p in STRUCTURED_PATTERNS))
+_TABLE_KEYWORD_RE = re.compile("|".join(map(re.escape, TABLE_KEYWORDS)))
+_TECH_DRAWING_KEYWORD_RE = re.compile("|".join(map(re.escape, TECH_DRAWING_KEYWORDS)))
+_DIMENSION_RE = re.compile("|".join(f"(?:{p})" for p in DIMENSION_PATTERNS))
+
 class Table:
     """Represents a detected table"""
     def __init__(self, bbox_px: List[int], cells: List[Dict], 
@@ -90,7 +132,8 @@ def detect_ruled_tables(img: np.ndarray, columns: List[Tuple[int, int]],
     if len(img.shape) == 3:
         gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
     else:
-        gray = img.copy()
+        # Already single-channel and only read from here on, so no copy
+        gray = img
     
     tables = []
     
@@ -629,18 +672,20 @@ def detect_column_structure(rows: List[List]) -> List[float]:
     if not rows:
         return []
     
-    # Collect all X coordinates
-    x_coords = []
+    # Collect all X coordinates (left and right edges) into a preallocated buffer
+    n_blocks = sum(len(row) for row in rows)
+    if n_blocks == 0:
+        return []
+    
+    x_coords = np.empty(2 * n_blocks, dtype=np.float64)
+    i = 0
     for row in rows:
         for block in row:
-            x_coords.append(block.bbox_px[0])  # left edge
-            x_coords.append(block.bbox_px[2])  # right edge
-    
-    if not x_coords:
-        return []
+            x_coords[i] = block.bbox_px[0]  # left edge
+            x_coords[i + 1] = block.bbox_px[2]  # right edge
+            i += 2
     
     # Cluster X coordinates
-    x_coords = np.array(x_coords)
     
     # Use simple clustering based on proximity
     x_coords_sorted = np.sort(x_coords)
@@ -999,37 +1044,14 @@ def is_tabular_row(row_blocks: List) -> bool:
                 return True
     
     # Pattern 2: Contains structured codes AND multiple blocks
-    structured_patterns = [
-        r'^[A-Z]{2,}\d+$',  # Codes like "VQFN32", "RSM32"
-        r'^\d+$',  # Pure numbers
-        r'^[A-Za-z]+-[A-Za-z]+$',  # Hyphenated codes like "Level-1"
-        r'^\d+-\d+$',  # Number ranges like "3000-250"
-        r'^[A-Z]{3,}\d+[A-Z]*$',  # Part numbers like "TPS51633RSMR"
-        r'^\([0-9]+\)$',  # Numbered items like "(1)", "(2)"
-    ]
-    
-    import re
-    pattern_count = 0
-    for text in texts:
-        if any(re.match(pattern, text) for pattern in structured_patterns):
-            pattern_count += 1
+    pattern_count = sum(1 for text in texts if _STRUCTURED_RE.match(text))
     
     # Need structured patterns AND multiple blocks (more flexible)
     if pattern_count >= MIN_STRUCTURED_PATTERNS and len(texts) >= 3:
         return True
     
     # Pattern 3: Table-specific keywords with proper alignment
-    table_keywords = [
-        'status', 'material', 'package', 'qty', 'rohs', 'lead', 'msl', 'temp',
-        'part', 'number', 'type', 'pins', 'carrier', 'finish', 'rating', 'reflow',
-        'active', 'production', 'vqfn', 'rsm', 'nipdau', 'level-1', 'unlimited',
-        'orderable', 'ball', 'peak', 'op', 'marking', 'addendum', 'information'
-    ]
-    
-    keyword_count = 0
-    for text in texts:
-        if any(keyword in text.lower() for keyword in table_keywords):
-            keyword_count += 1
+    keyword_count = sum(1 for text in texts if _TABLE_KEYWORD_RE.search(text.lower()))
     
     # Need keywords AND proper alignment for table-like content (more flexible)
     if keyword_count >= MIN_TABLE_KEYWORDS:
@@ -1085,27 +1107,6 @@ def is_technical_drawing_text(texts: List[str]) -> bool:
     Returns:
         True if this looks like technical drawing text
     """
-    import re
-    
-    # Technical drawing indicators
-    tech_keywords = [
-        'stencil', 'design', 'vqfn', 'quad', 'flatpack', 'lead', 'metal',
-        'laser', 'cutting', 'apertures', 'trapezoidal', 'rounded', 'corners',
-        'ipc-7525', 'texas', 'instruments', 'example', 'based', 'thick',
-        'printed', 'scale', 'continued', 'notes', 'symm', 'typ', 'max',
-        'height', 'width', 'diameter', 'radius', 'exposed', 'pad', 'solder',
-        'paste', 'coverage', 'area', 'package', 'mm', 'dimensions'
-    ]
-    
-    # Dimension patterns (very specific to technical drawings)
-    dimension_patterns = [
-        r'\(\d+\.?\d*\)',  # (0.715), (1.23), etc.
-        r'\(\d+\.?\d*\s*[A-Za-z]+\)',  # (R0.05) TYP, etc.
-        r'\d+X\s*\(\d+\.?\d*\)',  # 32X (0.55), 4X (1.23), etc.
-        r'^\d+\.\d+$',  # Pure decimal numbers like "0.715"
-        r'^[A-Z]\d+[A-Z]*\d*$',  # Part numbers like "RSM0032B"
-    ]
-    
     tech_keyword_count = 0
     dimension_count = 0
     
@@ -1113,14 +1114,12 @@ def is_technical_drawing_text(texts: List[str]) -> bool:
         text_lower = text.lower()
         
         # Count technical keywords
-        if any(keyword in text_lower for keyword in tech_keywords):
+        if _TECH_DRAWING_KEYWORD_RE.search(text_lower):
             tech_keyword_count += 1
         
         # Count dimension patterns
-        for pattern in dimension_patterns:
-            if re.search(pattern, text):
-                dimension_count += 1
-                break
+        if _DIMENSION_RE.search(text):
+            dimension_count += 1
     
     # If we have both technical keywords AND dimension patterns, it's likely a technical drawing
     if tech_keyword_count >= 2 and dimension_count >= 2:
@@ -9,6 +9,21 @@ import logging
 # Constants
 TEXT_MERGE_VGAP = 10  # pixels
 ROW_DY_FACTOR = 0.6   # for line baseline clustering
+CENTERED_MAX_WIDTH = 200  # pixels, narrow blocks are treated as centered
+
+# Common heading patterns
+HEADING_PATTERNS = [
+    r'^\d+\.?\s+[A-Z]',  # "1. Introduction" or "1 Introduction"
+    r'^[A-Z][A-Z\s]+$',  # "ABSTRACT" or "INTRODUCTION"
+    r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*$',  # "Introduction" or "Related Work"
+    r'^\d+\.\d+',  # "1.1" or "2.3"
+]
+
+# Compiled once at import instead of looked up in re's cache on every call
+_HEADING_RE = re.compile("|".join(f"(?:{p})" for p in HEADING_PATTERNS))
+_HYPHEN_NEWLINE_RE = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+_HYPHEN_SPACE_RE = re.compile(r'(\w+)-\s+(\w+)')
+_WHITESPACE_RE = re.compile(r'\s+')
 
 class TextBlock:
     """Represents a text block with bounding box and content"""
@@ -63,6 +78,61 @@ class TextBlock:
         overlap_ratio = area_i / min(area1, area2)
         return overlap_ratio >= threshold
 
+class TextBlockArray:
+    """
+    Struct-of-arrays view over a list of TextBlocks
+    
+    Geometry and font attributes are gathered into contiguous numpy arrays once,
+    so page-level passes (sorting, grouping, heading and column tests) can work
+    on whole columns instead of per-object attribute lookups. ``blocks`` keeps
+    the original objects, in the same order, for building results.
+    """
+    def __init__(self, blocks: List[TextBlock]):
+        n = len(blocks)
+        self.blocks = blocks
+        self.bboxes = np.array([b.bbox_px for b in blocks], dtype=np.float32).reshape(n, 4)
+        self.font_sizes = np.fromiter((b.font_size for b in blocks), dtype=np.float64, count=n)
+        self.is_bold = np.fromiter((b.is_bold for b in blocks), dtype=bool, count=n)
+    
+    def __len__(self) -> int:
+        return len(self.blocks)
+    
+    @property
+    def x0(self) -> np.ndarray:
+        return self.bboxes[:, 0]
+    
+    @property
+    def y0(self) -> np.ndarray:
+        return self.bboxes[:, 1]
+    
+    @property
+    def x1(self) -> np.ndarray:
+        return self.bboxes[:, 2]
+    
+    @property
+    def y1(self) -> np.ndarray:
+        return self.bboxes[:, 3]
+    
+    @property
+    def widths(self) -> np.ndarray:
+        return self.x1 - self.x0
+    
+    @property
+    def heights(self) -> np.ndarray:
+        return self.y1 - self.y0
+    
+    @property
+    def centers_x(self) -> np.ndarray:
+        return (self.x0 + self.x1) / 2
+    
+    @property
+    def centers_y(self) -> np.ndarray:
+        return (self.y0 + self.y1) / 2
+    
+    def take(self, indices: np.ndarray) -> List[TextBlock]:
+        """Return the TextBlock objects at ``indices``"""
+        return [self.blocks[i] for i in indices]
+
 def extract_text_blocks(raw_dict: Dict[str, Any]) -> List[TextBlock]:
     """
     Extract text blocks from PyMuPDF raw dictionary
@@ -87,8 +157,9 @@ def extract_text_blocks(raw_dict: Dict[str, Any]) -> List[TextBlock]:
             bbox = line["bbox"]  # [x0, y0, x1, y1] in points
             bbox_px = [int(coord * (150/72)) for coord in bbox]
             
-            # Collect text from all spans in the line
-            line_text = ""
+            # Collect text from all spans in the line; joined once at the end
+            # rather than rebuilding the string for every span
+            text_parts = []
             font_sizes = []
             is_bold = False
             is_italic = False
@@ -96,7 +167,7 @@ def extract_text_blocks(raw_dict: Dict[str, Any]) -> List[TextBlock]:
             for span in line["spans"]:
                 span_text = span.get("text", "").strip()
                 if span_text:
-                    line_text += span_text + " "
+                    text_parts.append(span_text)
                     font_sizes.append(span.get("size", 12))
                     
                     # Check font flags
@@ -106,11 +177,12 @@ def extract_text_blocks(raw_dict: Dict[str, Any]) -> List[TextBlock]:
                     if flags & 2**1:  # Italic flag
                         is_italic = True
             
-            if line_text.strip():
-                avg_font_size = np.mean(font_sizes) if font_sizes else 12
+            if text_parts:
+                # A handful of spans per line; plain arithmetic beats building an array
+                avg_font_size = sum(font_sizes) / len(font_sizes)
                 text_block = TextBlock(
                     bbox_px=bbox_px,
-                    text=line_text.strip(),
+                    text=" ".join(text_parts),
                     font_size=avg_font_size,
                     is_bold=is_bold,
                     is_italic=is_italic
@@ -133,38 +205,25 @@ def group_lines_into_paragraphs(blocks: List[TextBlock]) -> List[TextBlock]:
     if not blocks:
         return []
     
+    arr = TextBlockArray(blocks)
+    
     # Sort blocks by y-coordinate first, then by x-coordinate
-    blocks = sorted(blocks, key=lambda b: (b.bbox_px[1], b.bbox_px[0]))
+    order = np.lexsort((arr.x0, arr.y0))
+    y0 = arr.y0[order]
+    x0 = arr.x0[order]
     
     # Calculate median line height for baseline clustering
-    heights = [b.height for b in blocks]
-    median_height = np.median(heights)
+    median_height = np.median(arr.heights)
     baseline_threshold = median_height * ROW_DY_FACTOR
     
     # Group lines by baseline proximity, but be more conservative about horizontal grouping
-    line_groups = []
-    current_group = [blocks[0]]
+    page_width = 1275  # Approximate page width
+    column_threshold = page_width * 0.3  # 30% of page width
     
-    for i in range(1, len(blocks)):
-        prev_block = blocks[i-1]
-        curr_block = blocks[i]
-        
-        # Check if blocks are on same baseline
-        y_diff = abs(curr_block.bbox_px[1] - prev_block.bbox_px[1])
-        
-        # Also check if blocks are in similar horizontal position (same column)
-        x_diff = abs(curr_block.bbox_px[0] - prev_block.bbox_px[0])
-        page_width = 1275  # Approximate page width
-        column_threshold = page_width * 0.3  # 30% of page width
-        
-        if y_diff <= baseline_threshold and x_diff <= column_threshold:
-            current_group.append(curr_block)
-        else:
-            line_groups.append(current_group)
-            current_group = [curr_block]
-    
-    if current_group:
-        line_groups.append(current_group)
+    # A new group starts wherever a line is off the previous baseline or column
+    same_row = (np.abs(np.diff(y0)) <= baseline_threshold) & (np.abs(np.diff(x0)) <= column_threshold)
+    breaks = np.flatnonzero(~same_row) + 1
+    line_groups = [arr.take(idx) for idx in np.split(order, breaks)]
     
     # Merge lines within groups into paragraphs, but be more conservative
     paragraphs = []
@@ -225,17 +284,12 @@ def merge_blocks_to_paragraph(blocks: List[TextBlock]) -> TextBlock:
         return blocks[0]
     
     # Calculate combined bounding box
-    x0 = min(b.bbox_px[0] for b in blocks)
-    y0 = min(b.bbox_px[1] for b in blocks)
-    x1 = max(b.bbox_px[2] for b in blocks)
-    y1 = max(b.bbox_px[3] for b in blocks)
+    boxes = np.array([b.bbox_px for b in blocks])
+    x0, y0 = (int(v) for v in boxes[:, :2].min(axis=0))
+    x1, y1 = (int(v) for v in boxes[:, 2:].max(axis=0))
     
     # Combine text
-    text_parts = []
-    for block in blocks:
-        text_parts.append(block.text)
-    
-    combined_text = " ".join(text_parts)
+    combined_text = " ".join(block.text for block in blocks)
     
     # Fix hyphenations
     combined_text = fix_hyphenations(combined_text)
@@ -266,13 +320,13 @@ def fix_hyphenations(text: str) -> str:
         Text with hyphenations fixed
     """
     # Pattern for hyphenated words: word-\nword
-    text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+    text = _HYPHEN_NEWLINE_RE.sub(r'\1\2', text)
     
     # Pattern for hyphenated words: word- word
-    text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
+    text = _HYPHEN_SPACE_RE.sub(r'\1\2', text)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     return text.strip()
 
@@ -289,9 +343,11 @@ def detect_headings(blocks: List[TextBlock]) -> List[TextBlock]:
     if not blocks:
         return []
     
+    arr = TextBlockArray(blocks)
+    
     # Calculate font size statistics
-    font_sizes = [b.font_size for b in blocks if b.font_size > 0]
-    if not font_sizes:
+    font_sizes = arr.font_sizes[arr.font_sizes > 0]
+    if font_sizes.size == 0:
         return []
     
     mean_font_size = np.mean(font_sizes)
@@ -299,25 +355,18 @@ def detect_headings(blocks: List[TextBlock]) -> List[TextBlock]:
     # More conservative threshold - only clearly larger text
     threshold = mean_font_size + 2.0 * std_font_size
     
-    headings = []
-    for block in blocks:
-        is_heading = False
-        
-        # Check font size
-        if block.font_size >= threshold:
-            is_heading = True
-        
-        # Check if bold and centered (heuristic)
-        elif block.is_bold and is_centered(block):
-            is_heading = True
-        
-        # Check for heading patterns (only if font size is reasonable)
-        elif block.font_size >= mean_font_size and is_heading_pattern(block.text):
-            is_heading = True
-        
-        if is_heading:
-            block.is_heading = True
-            headings.append(block)
+    # Check font size, then bold and centered (heuristic), as whole-page masks
+    is_heading = (arr.font_sizes >= threshold) | (arr.is_bold & (arr.widths < CENTERED_MAX_WIDTH))
+    
+    # Check for heading patterns (only if font size is reasonable); the regex
+    # test is the only per-block work left, so run it on the remaining candidates
+    pattern_candidates = np.flatnonzero(~is_heading & (arr.font_sizes >= mean_font_size))
+    for i in pattern_candidates:
+        if is_heading_pattern(blocks[i].text):
+            is_heading[i] = True
+    
+    for i in np.flatnonzero(is_heading):
+        blocks[i].is_heading = True
     
     # Return all blocks, not just headings
     return blocks
@@ -335,7 +384,7 @@ def is_centered(block: TextBlock, tolerance: float = 0.1) -> bool:
     """
     # This is a simplified check - in practice, you'd need page width
     # For now, assume blocks with small width relative to their position are centered
-    return block.width < 200  # Simple heuristic
+    return block.width < CENTERED_MAX_WIDTH  # Simple heuristic
 
 def is_heading_pattern(text: str) -> bool:
     """
@@ -347,19 +396,7 @@ def is_heading_pattern(text: str) -> bool:
     Returns:
         True if text appears to be a heading
     """
-    # Common heading patterns
-    patterns = [
-        r'^\d+\.?\s+[A-Z]',  # "1. Introduction" or "1 Introduction"
-        r'^[A-Z][A-Z\s]+$',  # "ABSTRACT" or "INTRODUCTION"
-        r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*$',  # "Introduction" or "Related Work"
-        r'^\d+\.\d+',  # "1.1" or "2.3"
-    ]
-    
-    for pattern in patterns:
-        if re.match(pattern, text.strip()):
-            return True
-    
-    return False
+    return _HEADING_RE.match(text.strip()) is not None
 
 def filter_blocks_in_columns(blocks: List[TextBlock], columns: List[Tuple[int, int]]) -> List[TextBlock]:
     """
@@ -372,15 +409,17 @@ def filter_blocks_in_columns(blocks: List[TextBlock], columns: List[Tuple[int, i
     Returns:
         Filtered list of TextBlock objects
     """
-    if not columns:
+    if not columns or not blocks:
         return blocks
     
-    filtered = []
-    for block in blocks:
-        center_x = block.center_x
-        for x0, x1 in columns:
-            if x0 <= center_x < x1:
-                filtered.append(block)
-                break
+    # Columns are disjoint, so each center falls in at most the column with the
+    # closest start to its left; locate it for all blocks at once
+    col_bounds = np.array(sorted(columns), dtype=np.float32)
+    centers = TextBlockArray(blocks).centers_x
+    
+    idx = np.searchsorted(col_bounds[:, 0], centers, side='right') - 1
+    valid = idx >= 0
+    inside = np.zeros(len(blocks), dtype=bool)
+    inside[valid] = centers[valid] < col_bounds[idx[valid], 1]
     
-    return filtered
+    return [blocks[i] for i in np.flatnonzero(inside)]
@@ -3,10 +3,11 @@ Extraction modules for content extraction using external services.
 Contains Mistral OCR integration and hybrid processing approaches.
 """
 
-from .mistral_service import MistralOCR
+from .mistral_service import MistralOCR, get_mistral_ocr
 from .content_extractor import extract_tables_hybrid
 
 __all__ = [
     'MistralOCR',
+    'get_mistral_ocr',
     'extract_tables_hybrid'
 ]
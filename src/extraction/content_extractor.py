@@ -7,7 +7,7 @@ Hybrid processor that combines:
 import logging
 from typing import List, Dict, Any, Tuple
 import numpy as np
-from .mistral_service import MistralOCR, create_mistral_table
+from .mistral_service import create_mistral_table, get_mistral_ocr
 from ..detection.figure_detector import detect_figures
 from ..detection.text_detector import TextBlock
 from ..detection.table_detector import Table
@@ -16,7 +16,7 @@ class HybridProcessor:
     """Hybrid processor combining Mistral OCR and custom algorithms."""
     
     def __init__(self):
-        self.mistral_ocr = MistralOCR()
+        self.mistral_ocr = get_mistral_ocr()
     
     def process_page(self, pdf_path: str, page_number: int, page_image: np.ndarray, 
                     text_blocks: List[TextBlock], columns: List[Tuple[int, int]], 
@@ -141,7 +141,7 @@ def extract_tables_hybrid(img: np.ndarray, text_blocks: List, columns: List[Tupl
     
     try:
         # Use Mistral OCR for table detection
-        mistral_ocr = MistralOCR()
+        mistral_ocr = get_mistral_ocr()
         mistral_content = mistral_ocr.process_pdf_page(pdf_path, page_number)
         
         # Convert Mistral tables to our format
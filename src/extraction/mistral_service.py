@@ -14,6 +14,9 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Markdown table separator lines (only |, - and spaces)
+_TABLE_SEPARATOR_RE = re.compile(r'^[\s\|\-]+$')
+
 class MistralOCR:
     """Mistral OCR client for structured content extraction."""
     
@@ -24,6 +27,60 @@ class MistralOCR:
         
         self.client = Mistral(api_key=self.api_key)
         self.model = "mistral-ocr-latest"
+        # OCR response for the document currently being processed; it covers
+        # every page, keyed by (path, mtime). Only one document is held at a time.
+        self._response_cache: Dict[tuple, Any] = {}
+    
+    def _get_document_response(self, pdf_path: str) -> Any:
+        """
+        Run Mistral OCR on a whole PDF, reusing the response for later pages.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Mistral OCR response covering every page of the document
+        """
+        cache_key = (os.path.abspath(pdf_path), os.path.getmtime(pdf_path))
+        if cache_key in self._response_cache:
+            return self._response_cache[cache_key]
+        
+        # Encode PDF to base64
+        with open(pdf_path, "rb") as pdf_file:
+            pdf_content = base64.b64encode(pdf_file.read()).decode('utf-8')
+        
+        logging.debug("PDF encoded, size: %d characters", len(pdf_content))
+        
+        # Process with Mistral OCR
+        logging.debug("Calling Mistral OCR API...")
+        # Failures are not cached: a network or rate-limit error may be
+        # transient, so the next page tries again
+        response = self.client.ocr.process(
+            model=self.model,
+            document={
+                "type": "document_url",
+                "document_url": f"data:application/pdf;base64,{pdf_content}"
+            },
+            # Figures/images come from our own renderer; only the markdown is
+            # read back, so don't have every embedded image encoded and sent
+            include_image_base64=False
+        )
+        
+        # A new document replaces the previous one's response
+        self._response_cache.clear()
+        self._response_cache[cache_key] = response
+        return response
+    
+    def release_document(self, pdf_path: str) -> None:
+        """
+        Drop the cached OCR response for a document once all its pages are done.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        """
+        path = os.path.abspath(pdf_path)
+        for key in [key for key in self._response_cache if key[0] == path]:
+            del self._response_cache[key]
     
     def process_pdf_page(self, pdf_path: str, page_number: int) -> Dict[str, Any]:
         """
@@ -37,34 +94,22 @@ class MistralOCR:
             Dictionary containing extracted content
         """
         try:
-            print(f"    🔍 Processing PDF: {pdf_path}")
-            print(f"    🔍 Page number: {page_number}")
-            
-            # Encode PDF to base64
-            with open(pdf_path, "rb") as pdf_file:
-                pdf_content = base64.b64encode(pdf_file.read()).decode('utf-8')
-            
-            print(f"    🔍 PDF encoded, size: {len(pdf_content)} characters")
-            
-            # Process with Mistral OCR
-            print(f"    🔍 Calling Mistral OCR API...")
-            response = self.client.ocr.process(
-                model=self.model,
-                document={
-                    "type": "document_url",
-                    "document_url": f"data:application/pdf;base64,{pdf_content}"
-                },
-                include_image_base64=True
-            )
+            logging.debug("Mistral OCR page %d of %s", page_number, pdf_path)
             
-            print(f"    🔍 Mistral response type: {type(response)}")
-            print(f"    🔍 Mistral response attributes: {dir(response)}")
+            # The API processes the whole document, so only call it once per PDF
+            response = self._get_document_response(pdf_path)
             
-            # Check what's actually in the response
-            if hasattr(response, 'pages'):
-                print(f"    🔍 Response has pages: {len(response.pages) if response.pages else 0}")
-                if response.pages:
-                    print(f"    🔍 First page keys: {list(response.pages[0].__dict__.keys()) if hasattr(response.pages[0], '__dict__') else 'No dict'}")
+            # Response introspection is only worth building when someone is
+            # reading debug output; dir() on every page is not free
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Mistral response type: {type(response)}")
+                logging.debug(f"Mistral response attributes: {dir(response)}")
+                
+                # Check what's actually in the response
+                if hasattr(response, 'pages'):
+                    logging.debug(f"Response has pages: {len(response.pages) if response.pages else 0}")
+                    if response.pages:
+                        logging.debug(f"First page keys: {list(response.pages[0].__dict__.keys()) if hasattr(response.pages[0], '__dict__') else 'No dict'}")
             
             # Extract tables and text from the response
             extracted_content = self._parse_ocr_response(response, page_number)
@@ -72,15 +117,28 @@ class MistralOCR:
             return extracted_content
             
         except Exception as e:
-            print(f"    ❌ Error processing PDF page {page_number} with Mistral OCR: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                "page_number": page_number,
-                "tables": [],
-                "text_blocks": [],
-                "error": str(e)
-            }
+            logging.error(f"Error processing PDF page {page_number} with Mistral OCR: {e}",
+                          exc_info=logging.getLogger().isEnabledFor(logging.DEBUG))
+            return self._fallback_result(page_number, e)
+    
+    @staticmethod
+    def _fallback_result(page_number: int, error: Exception) -> Dict[str, Any]:
+        """
+        Build the empty result returned when OCR is unavailable for a page.
+        
+        Args:
+            page_number: Page number (1-indexed)
+            error: Exception that prevented OCR
+            
+        Returns:
+            Dictionary with no tables or text blocks and the error message
+        """
+        return {
+            "page_number": page_number,
+            "tables": [],
+            "text_blocks": [],
+            "error": str(error)
+        }
     
     def _parse_ocr_response(self, response: Any, page_number: int) -> Dict[str, Any]:
         """
@@ -105,12 +163,12 @@ class MistralOCR:
                 if 0 <= page_index < len(response.pages):
                     page = response.pages[page_index]
                     markdown_content = getattr(page, 'markdown', '')
-                    print(f"    🔍 Page {page_number} markdown length: {len(markdown_content)}")
-                    print(f"    🔍 Page {page_number} markdown preview: {markdown_content[:200]}...")
+                    logging.debug("Page %d markdown length: %d", page_number, len(markdown_content))
+                    logging.debug("Page %d markdown preview: %s...", page_number, markdown_content[:200])
                 else:
-                    print(f"    ⚠️ Page {page_number} not found in response (has {len(response.pages)} pages)")
+                    logging.warning(f"Page {page_number} not found in response (has {len(response.pages)} pages)")
             else:
-                print(f"    ⚠️ No pages found in response")
+                logging.warning("No pages found in response")
             
             # Parse tables from markdown
             tables = self._extract_tables_from_markdown(markdown_content)
@@ -118,12 +176,10 @@ class MistralOCR:
             # Parse text blocks
             text_blocks = self._extract_text_blocks_from_markdown(markdown_content)
             
-            print(f"    🔍 Parsed {len(tables)} tables, {len(text_blocks)} text blocks from markdown")
+            logging.debug("Parsed %d tables, %d text blocks from markdown", len(tables), len(text_blocks))
             
         except Exception as e:
-            print(f"    ❌ Error parsing Mistral OCR response: {e}")
-            import traceback
-            traceback.print_exc()
+            logging.error(f"Error parsing Mistral OCR response: {e}", exc_info=True)
         
         return {
             "page_number": page_number,
@@ -168,7 +224,7 @@ class MistralOCR:
                             "bbox_px": [0, 0, 0, 0],  # Will be enhanced with bboxes if available
                             "detection_method": "mistral_ocr"
                         })
-                        print(f"    🔍 Found table with {len(table_data)} rows")
+                        logging.debug("Found table with %d rows", len(table_data))
                     current_table = []
                     in_table = False
         
@@ -181,7 +237,7 @@ class MistralOCR:
                     "bbox_px": [0, 0, 0, 0],
                     "detection_method": "mistral_ocr"
                 })
-                print(f"    🔍 Found final table with {len(table_data)} rows")
+                logging.debug("Found final table with %d rows", len(table_data))
         
         return tables
     
@@ -198,7 +254,7 @@ class MistralOCR:
         rows = []
         for line in table_lines:
             # Skip separator lines (lines with only |, -, and spaces)
-            if re.match(r'^[\s\|\-]+$', line):
+            if _TABLE_SEPARATOR_RE.match(line):
                 continue
                 
             # Split by | and clean up
@@ -212,7 +268,7 @@ class MistralOCR:
             # Only add rows that have meaningful content
             if cells and any(cell.strip() for cell in cells):
                 rows.append(cells)
-                print(f"    🔍 Table row: {cells}")
+                logging.debug("Table row: %s", cells)
         
         return rows
     
@@ -252,6 +308,34 @@ class MistralOCR:
         # For now, return text blocks as-is
         return text_blocks
 
+_shared_ocr: Optional[MistralOCR] = None
+_shared_ocr_error: Optional[Exception] = None
+
+def get_mistral_ocr() -> MistralOCR:
+    """
+    Return the process-wide MistralOCR client, creating it on first use.
+    
+    Sharing one client keeps a single HTTP client and a single whole-document
+    response cache, instead of rebuilding both for every page or table lookup.
+    
+    Returns:
+        Shared MistralOCR instance
+        
+    Raises:
+        ValueError: If MISTRAL_API_KEY is not configured
+    """
+    global _shared_ocr, _shared_ocr_error
+    if _shared_ocr is None:
+        # Don't retry construction on every page once it is known to fail
+        if _shared_ocr_error is not None:
+            raise _shared_ocr_error
+        try:
+            _shared_ocr = MistralOCR()
+        except Exception as e:
+            _shared_ocr_error = e
+            raise
+    return _shared_ocr
+
 def create_mistral_table(table_data: Dict[str, Any]) -> 'Table':
     """
     Convert Mistral table data to our Table class.
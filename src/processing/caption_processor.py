@@ -8,6 +8,28 @@ import logging
 # Constants
 CAPTION_BAND_FACTOR = 1.2  # Vertical search band factor
 
+# Common caption patterns
+CAPTION_PATTERNS = [
+    r'^(Fig\.|Figure)\s*[\w\-\.\(\)]*',  # "Fig. 1", "Figure 2.1"
+    r'^(Table)\s*[\w\-\.\(\)]*',         # "Table 1", "Table 2.1"
+    r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*\s*\([A-Za-z0-9\s\-\.]+\)',  # "Caption (a)"
+    r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*\s*[0-9]+',  # "Caption 1"
+]
+
+# Compiled once at import instead of on every caption candidate
+_CAPTION_RE = re.compile("|".join(f"(?:{p})" for p in CAPTION_PATTERNS), re.IGNORECASE)
+_FIGURE_WORD_RE = re.compile(r'(fig|figure)', re.IGNORECASE)
+_TABLE_WORD_RE = re.compile(r'table', re.IGNORECASE)
+_CAPTION_NUMBER_RES = [
+    re.compile(r'(Fig\.|Figure)\s*([\w\-\.\(\)]+)', re.IGNORECASE),
+    re.compile(r'(Table)\s*([\w\-\.\(\)]+)', re.IGNORECASE),
+    re.compile(r'([0-9]+)', re.IGNORECASE),
+]
+_CAPTION_PREFIX_RES = [
+    re.compile(r'^(Fig\.|Figure)\s*[\w\-\.\(\)]*\s*:?\s*', re.IGNORECASE),
+    re.compile(r'^(Table)\s*[\w\-\.\(\)]*\s*:?\s*', re.IGNORECASE),
+]
+
 class Caption:
     """Represents a detected caption"""
     def __init__(self, bbox_px: List[int], text: str, 
@@ -89,20 +111,7 @@ def is_caption_text(text: str) -> bool:
     Returns:
         True if text appears to be a caption
     """
-    # Common caption patterns
-    patterns = [
-        r'^(Fig\.|Figure)\s*[\w\-\.\(\)]*',  # "Fig. 1", "Figure 2.1"
-        r'^(Table)\s*[\w\-\.\(\)]*',         # "Table 1", "Table 2.1"
-        r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*\s*\([A-Za-z0-9\s\-\.]+\)',  # "Caption (a)"
-        r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*\s*[0-9]+',  # "Caption 1"
-    ]
-    
-    text = text.strip()
-    for pattern in patterns:
-        if re.match(pattern, text, re.IGNORECASE):
-            return True
-    
-    return False
+    return _CAPTION_RE.match(text.strip()) is not None
 
 def find_caption_for_object(obj: Any, caption_blocks: List, obj_type: str) -> Optional[Caption]:
     """
@@ -236,9 +245,9 @@ def score_caption(block: Any, obj_type: str) -> float:
         score += 0.5
     
     # Bonus for matching object type
-    if obj_type == "figure" and re.search(r'(fig|figure)', text, re.IGNORECASE):
+    if obj_type == "figure" and _FIGURE_WORD_RE.search(text):
         score += 0.3
-    elif obj_type == "table" and re.search(r'table', text, re.IGNORECASE):
+    elif obj_type == "table" and _TABLE_WORD_RE.search(text):
         score += 0.3
     
     # Bonus for smaller font size (captions are often smaller)
@@ -267,15 +276,8 @@ def extract_caption_number(text: str) -> Optional[str]:
     Returns:
         Caption number if found, None otherwise
     """
-    # Patterns for caption numbers
-    patterns = [
-        r'(Fig\.|Figure)\s*([\w\-\.\(\)]+)',
-        r'(Table)\s*([\w\-\.\(\)]+)',
-        r'([0-9]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _CAPTION_NUMBER_RES:
+        match = pattern.search(text)
         if match:
             return match.group(2) if len(match.groups()) > 1 else match.group(1)
     
@@ -292,14 +294,9 @@ def extract_caption_content(text: str) -> str:
         Caption content without the number
     """
     # Remove common caption prefixes
-    patterns = [
-        r'^(Fig\.|Figure)\s*[\w\-\.\(\)]*\s*:?\s*',
-        r'^(Table)\s*[\w\-\.\(\)]*\s*:?\s*',
-    ]
-    
     content = text
-    for pattern in patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+    for pattern in _CAPTION_PREFIX_RES:
+        content = pattern.sub('', content)
     
     return content.strip()
 
@@ -2,18 +2,20 @@
 Quanta PDF extraction SDK
 
 Public API:
-- extract_document(input_pdf, output_dir, debug=False) -> dict
+- extract_document(input_pdf, output_dir, debug=False, workers=1) -> dict
+- extract_documents(input_pdfs, output_root, workers=None) -> list[dict]
 
 Returns a dict compatible with the existing pipeline result, including per-page
 artifacts and summary paths.
 """
 
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 # Import from existing internal modules installed as top-level packages
 # These modules already exist under src/core, src/detection, etc.
-from ..core.pipeline_processor import process_pdf  # type: ignore
+from ..core.pipeline_processor import process_pdf, process_pdf_parallel, limit_worker_threads  # type: ignore
 from .types import ExtractConfig, ExtractResult, ExtractPageArtifacts
 
 
@@ -22,6 +24,7 @@ def extract_document(
     output_dir: Union[str, Path],
     *,
     debug: bool = False,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """Run the full extraction pipeline and return the result dict.
 
@@ -33,6 +36,10 @@ def extract_document(
         Directory to write outputs (images, CSVs, text, summary.json).
     debug: bool
         If True, downstream consumers can choose to draw overlays separately.
+    workers: int
+        Number of worker processes to spread pages across; 1 runs in-process.
+        With more than one worker the returned pages don't include the
+        ``img_page`` arrays (read the saved page images instead).
 
     Returns
     -------
@@ -41,9 +48,93 @@ def extract_document(
     """
     input_path = str(input_pdf)
     output_path = str(output_dir)
+    if workers > 1:
+        return process_pdf_parallel(input_path, output_path, workers=workers)
     return process_pdf(input_path, output_path)
 
 
+def _extract_one(job: Tuple[str, str]) -> Dict[str, Any]:
+    """Pool worker: run extract_document for one (input_pdf, output_dir) pair.
+
+    Rendered page images are dropped before the result is pickled back to the
+    parent; they are already on disk as page_XX.png and would otherwise make
+    the parent hold every page image of every document at once.
+
+    Errors are returned as a record instead of raised, so one bad document
+    doesn't abort the rest of the batch.
+    """
+    input_pdf, output_dir = job
+    try:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        result = extract_document(input_pdf, output_dir)
+    except Exception as exc:
+        return {"input_pdf": input_pdf, "output_dir": output_dir, "pages": [],
+                "summary_path": None, "error": str(exc)}
+    for page in result.get("pages", []):
+        page.pop("img_page", None)
+    result.update(input_pdf=input_pdf, output_dir=output_dir, error=None)
+    return result
+
+
+def _unique_output_dirs(input_pdfs: Sequence[Union[str, Path]], root: Path) -> List[Path]:
+    """Map each PDF to ``root/<stem>``, suffixing repeated stems with _2, _3, ...
+
+    Inputs from different folders can share a file stem; without this they
+    would write into (and overwrite) the same output directory.
+    """
+    used = set()
+    dirs = []
+    for pdf in input_pdfs:
+        stem = Path(pdf).stem
+        name, n = stem, 1
+        while name in used:
+            n += 1
+            name = f"{stem}_{n}"
+        used.add(name)
+        dirs.append(root / name)
+    return dirs
+
+
+def extract_documents(
+    input_pdfs: Sequence[Union[str, Path]],
+    output_root: Union[str, Path],
+    *,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Run the pipeline over several PDFs in parallel worker processes.
+
+    Documents are independent, so each one is processed in its own worker and
+    written to ``output_root/<pdf stem>``. Inputs sharing a stem get ``_2``,
+    ``_3``, ... suffixes so no two documents write to the same directory.
+
+    Parameters
+    ----------
+    input_pdfs: sequence of str | Path
+        PDF files to process.
+    output_root: str | Path
+        Parent directory for the per-document output directories.
+    workers: int, optional
+        Number of worker processes (defaults to the CPU count).
+
+    Returns
+    -------
+    list of dict
+        One record per input, in input order: the process_pdf result without
+        the in-memory ``img_page`` arrays (read the saved page images instead),
+        plus ``input_pdf``, ``output_dir`` and ``error`` (None on success). A
+        failed document has ``error`` set and no pages.
+    """
+    root = Path(output_root)
+    jobs = [(str(pdf), str(out)) for pdf, out in zip(input_pdfs, _unique_output_dirs(input_pdfs, root))]
+    if not jobs:
+        return []
+
+    with Pool(processes=workers, initializer=limit_worker_threads) as pool:
+        # imap unpickles each result as its document finishes instead of
+        # waiting for the whole batch
+        return list(pool.imap(_extract_one, jobs, chunksize=1))
+
+
 def extract(
     config: ExtractConfig,
 ) -> ExtractResult:
@@ -51,7 +142,9 @@ def extract(
 
     Builds a normalized ExtractResult with concrete artifact paths.
     """
-    result = extract_document(str(config.input_pdf), str(config.output_dir), debug=config.debug)
+    result = extract_document(
+        str(config.input_pdf), str(config.output_dir), debug=config.debug, workers=config.workers
+    )
     pages: List[ExtractPageArtifacts] = []
     total_figures = 0
     total_tables = 0
@@ -104,6 +197,6 @@ def extract(
     )
 
 
-__all__ = ["extract_document", "extract", "ExtractConfig", "ExtractResult", "ExtractPageArtifacts"]
+__all__ = ["extract_document", "extract_documents", "extract", "ExtractConfig", "ExtractResult", "ExtractPageArtifacts"]
 
 
@@ -16,6 +16,9 @@ def main() -> int:
     parser.add_argument(
         "--debug", action="store_true", help="Enable debug overlays in downstream tools"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for page-level parallelism"
+    )
 
     args = parser.parse_args()
     input_pdf = Path(args.input)
@@ -28,7 +31,9 @@ def main() -> int:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        result = extract_document(str(input_pdf), str(output_dir), debug=args.debug)
+        result = extract_document(
+            str(input_pdf), str(output_dir), debug=args.debug, workers=args.workers
+        )
         pages = result.get("pages", [])
         total_figures = sum(len(p.get("figures", [])) for p in pages)
         total_tables = sum(len(p.get("tables", [])) for p in pages)
@@ -9,6 +9,7 @@ class ExtractConfig:
     output_dir: Path
     pages: Optional[List[int]] = None  # 1-indexed page numbers if provided
     debug: bool = False
+    workers: int = 1  # >1 processes pages in parallel worker processes
 
 
 @dataclass
@@ -3,8 +3,10 @@ Utility modules and helper functions.
 Contains ML models and other utility functions.
 """
 
-from .ml_models import TableMLModel
+from .ml_models import detect_tables_ml, is_tabular_row, classify_tabular_rows
 
 __all__ = [
-    'TableMLModel'
+    'detect_tables_ml',
+    'is_tabular_row',
+    'classify_tabular_rows'
 ]
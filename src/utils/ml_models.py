@@ -2,6 +2,7 @@
 Clean ML-based table detection without hardcoded patterns.
 """
 
+import re
 import numpy as np
 from typing import List, Dict, Optional
 from ..detection.text_detector import TextBlock
@@ -12,6 +13,34 @@ MIN_COLUMN_SPACING = 15
 MAX_COLUMN_SPACING = 300
 MIN_ROW_ALIGNMENT = 30
 
+# Row classification thresholds (see is_tabular_row)
+MAX_CELL_TEXT_LENGTH = 40
+MIN_CELL_GAP = 30
+MAX_ROW_Y_SPREAD = 15
+MIN_ROW_SPAN = 100
+
+SENTENCE_INDICATORS = ['.', '!', '?']
+DESCRIPTIVE_WORDS = ['features', 'description', 'applications', 'simplified', 'schematic', 'figure']
+
+# Content cues used by extract_table_features
+STRUCTURED_PATTERNS = [
+    r'^\d+$',  # Pure numbers
+    r'^\d+\.\d+$',  # Decimal numbers
+    r'^[A-Z]{2,}\d+$',  # Codes like "VQFN32"
+    r'^[A-Za-z]+-[A-Za-z]+$',  # Hyphenated like "Level-1"
+    r'^\d+-\d+$',  # Number ranges
+    r'^[A-Z]{3,}\d+[A-Z]*$',  # Part numbers
+]
+TECH_KEYWORDS = ['stencil', 'design', 'vqfn', 'quad', 'flatpack', 'laser', 'cutting', 'apertures']
+DESCRIPTIVE_INDICATORS = ['simplified', 'schematic', 'figure', 'description', 'the following', 'as shown']
+
+_SENTENCE_RE = re.compile('|'.join(map(re.escape, SENTENCE_INDICATORS)))
+_DESCRIPTIVE_RE = re.compile('|'.join(map(re.escape, DESCRIPTIVE_WORDS)))
+_STRUCTURED_RE = re.compile('|'.join(f'(?:{p})' for p in STRUCTURED_PATTERNS))
+_DIGIT_RE = re.compile(r'\d')
+_TECH_RE = re.compile('|'.join(map(re.escape, TECH_KEYWORDS)))
+_DESCRIPTIVE_INDICATOR_RE = re.compile('|'.join(map(re.escape, DESCRIPTIVE_INDICATORS)))
+
 class Table:
     """Represents a detected table"""
     def __init__(self, bbox_px: List[int], cells: List[Dict], 
@@ -39,17 +68,15 @@ def is_tabular_row(row_blocks: List[TextBlock], page_width: int, page_height: in
     texts = [block.text.strip() for block in row_blocks]
     
     # STRICT REJECTION: If any text is too long (paragraphs, not table cells)
-    if any(len(text) > 40 for text in texts):
+    if any(len(text) > MAX_CELL_TEXT_LENGTH for text in texts):
         return False
     
     # STRICT REJECTION: If text contains sentence indicators (paragraphs, not table cells)
-    sentence_indicators = ['.', '!', '?']
-    if any(any(indicator in text for indicator in sentence_indicators) for text in texts):
+    if any(_SENTENCE_RE.search(text) for text in texts):
         return False
     
     # STRICT REJECTION: If text looks like descriptive content
-    descriptive_words = ['features', 'description', 'applications', 'simplified', 'schematic', 'figure']
-    if any(any(word in text.lower() for word in descriptive_words) for text in texts):
+    if any(_DESCRIPTIVE_RE.search(text.lower()) for text in texts):
         return False
     
     # STRUCTURAL ANALYSIS: Check for proper table structure
@@ -59,19 +86,19 @@ def is_tabular_row(row_blocks: List[TextBlock], page_width: int, page_height: in
     
     # Check column spacing (must be significant)
     gaps = [x_coords[i+1] - x_coords[i] for i in range(len(x_coords)-1)]
-    if not gaps or min(gaps) < 30:  # Must have significant spacing
+    if not gaps or min(gaps) < MIN_CELL_GAP:  # Must have significant spacing
         return False
     
     # Check vertical alignment (must be very tight)
     y_variance = max(y_coords) - min(y_coords)
-    if y_variance > 15:  # Must be very well aligned
+    if y_variance > MAX_ROW_Y_SPREAD:  # Must be very well aligned
         return False
     
     # Check if content looks like table data (short, structured)
     if len(texts) >= 2:
         # Must have at least 2 columns with proper spacing
         total_width = x_coords[-1] - x_coords[0]
-        if total_width > 100:  # Must span a reasonable width
+        if total_width > MIN_ROW_SPAN:  # Must span a reasonable width
             return True
     
     return False
@@ -102,31 +129,19 @@ def extract_table_features(row_blocks: List[TextBlock], page_width: int, page_he
         text_length_consistency = 1.0
     
     # Check for structured data patterns
-    import re
-    structured_patterns = [
-        r'^\d+$',  # Pure numbers
-        r'^\d+\.\d+$',  # Decimal numbers
-        r'^[A-Z]{2,}\d+$',  # Codes like "VQFN32"
-        r'^[A-Za-z]+-[A-Za-z]+$',  # Hyphenated like "Level-1"
-        r'^\d+-\d+$',  # Number ranges
-        r'^[A-Z]{3,}\d+[A-Z]*$',  # Part numbers
-    ]
-    has_structured_data = any(any(re.match(pattern, text) for pattern in structured_patterns) for text in texts)
+    has_structured_data = any(_STRUCTURED_RE.match(text) for text in texts)
     
     # Check for numeric content
-    has_numeric_content = any(re.search(r'\d', text) for text in texts)
+    has_numeric_content = any(_DIGIT_RE.search(text) for text in texts)
     
     # Check for sentence indicators
-    sentence_indicators = ['.', '!', '?']
-    has_sentence_indicators = any(any(indicator in text for indicator in sentence_indicators) for text in texts)
+    has_sentence_indicators = any(_SENTENCE_RE.search(text) for text in texts)
     
     # Check if technical drawing (simplified)
-    tech_keywords = ['stencil', 'design', 'vqfn', 'quad', 'flatpack', 'laser', 'cutting', 'apertures']
-    is_technical_drawing = any(any(keyword in text.lower() for keyword in tech_keywords) for text in texts)
+    is_technical_drawing = any(_TECH_RE.search(text.lower()) for text in texts)
     
     # Check if descriptive text
-    descriptive_indicators = ['simplified', 'schematic', 'figure', 'description', 'the following', 'as shown']
-    is_descriptive_text = any(any(indicator in text.lower() for indicator in descriptive_indicators) for text in texts)
+    is_descriptive_text = any(_DESCRIPTIVE_INDICATOR_RE.search(text.lower()) for text in texts)
     
     return {
         'num_blocks': len(row_blocks),
@@ -159,17 +174,70 @@ def detect_tables_ml(text_blocks: List[TextBlock], page_width: int, page_height:
     # Group text blocks into rows based on y-coordinate proximity
     rows = group_blocks_into_rows(text_blocks)
     
-    # Find table rows using ML
-    table_rows = []
-    for row in rows:
-        if is_tabular_row(row, page_width, page_height):
-            table_rows.append(row)
+    # Find table rows using ML, classifying every row on the page in one pass
+    is_table_row = classify_tabular_rows(rows, page_width, page_height)
+    table_rows = [row for row, keep in zip(rows, is_table_row) if keep]
     
     # Group consecutive table rows into tables
     tables = group_rows_into_tables(table_rows)
     
     return tables
 
+def classify_tabular_rows(rows: List[List[TextBlock]], page_width: int, page_height: int) -> np.ndarray:
+    """
+    Apply the is_tabular_row checks to all rows of a page at once.
+    
+    Blocks from every row are flattened into arrays with per-row segments, so
+    the spacing, alignment and span tests become segmented numpy reductions
+    instead of one Python call per row.
+    
+    Args:
+        rows: Rows of TextBlock objects, as produced by group_blocks_into_rows
+        page_width: Width of the page in pixels
+        page_height: Height of the page in pixels
+        
+    Returns:
+        Boolean array, True where the row looks like a table row
+    """
+    if not rows:
+        return np.zeros(0, dtype=bool)
+    
+    counts = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    if not counts.all():
+        # reduceat cannot express empty segments; fall back for odd input
+        return np.array([is_tabular_row(row, page_width, page_height) for row in rows], dtype=bool)
+    
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    row_ids = np.repeat(np.arange(len(rows)), counts)
+    
+    blocks = [block for row in rows for block in row]
+    bboxes = np.array([block.bbox_px for block in blocks], dtype=np.float32).reshape(-1, 4)
+    
+    # Content rejections: long cells, sentence punctuation, descriptive words
+    rejected = np.fromiter(
+        (len(text) > MAX_CELL_TEXT_LENGTH
+         or _SENTENCE_RE.search(text) is not None
+         or _DESCRIPTIVE_RE.search(text.lower()) is not None
+         for text in (block.text.strip() for block in blocks)),
+        dtype=bool, count=len(blocks)
+    )
+    row_rejected = np.logical_or.reduceat(rejected, starts)
+    
+    # Column spacing: smallest gap between consecutive x0 values within a row
+    order = np.lexsort((bboxes[:, 0], row_ids))
+    xs = bboxes[order, 0]
+    gaps = np.full(len(xs), np.inf, dtype=np.float32)
+    gaps[1:] = np.diff(xs)
+    gaps[starts] = np.inf  # the first block of a row has no left neighbour
+    min_gap = np.minimum.reduceat(gaps, starts)
+    
+    # Vertical alignment and total span
+    y_spread = np.maximum.reduceat(bboxes[:, 1], starts) - np.minimum.reduceat(bboxes[:, 1], starts)
+    span = np.maximum.reduceat(xs, starts) - np.minimum.reduceat(xs, starts)
+    
+    return ((counts >= 2) & ~row_rejected & (min_gap >= MIN_CELL_GAP)
+            & (y_spread <= MAX_ROW_Y_SPREAD) & (span > MIN_ROW_SPAN))
+
 def group_blocks_into_rows(text_blocks: List[TextBlock]) -> List[List[TextBlock]]:
     """Group text blocks into rows based on strict y-coordinate proximity."""
     if not text_blocks:
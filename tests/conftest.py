@@ -0,0 +1,33 @@
+"""
+Shared test helpers
+"""
+import random
+
+import pytest
+
+RANDOM_SEEDS = range(20)
+
+
+def _assert_matches_reference(function, reference, make_args, normalize=lambda result: result,
+                              seeds=RANDOM_SEEDS):
+    """
+    Check a rewritten function against a copy of the loop it replaced
+
+    Args:
+        function: Function under test
+        reference: Original implementation, kept verbatim in the test module
+        make_args: Builds the positional arguments from a seeded random.Random
+        normalize: Maps a result to something comparable with ==
+        seeds: Seeds to generate inputs from
+    """
+    for seed in seeds:
+        args = make_args(random.Random(seed))
+        expected = normalize(reference(*args))
+        actual = normalize(function(*args))
+        assert actual == expected, f"mismatch for seed {seed}"
+
+
+@pytest.fixture
+def assert_matches_reference():
+    """Randomized equivalence check against a reference implementation"""
+    return _assert_matches_reference
@@ -0,0 +1,317 @@
+"""
+Tests for figure detection and merging
+"""
+import logging
+
+import fitz
+import pytest
+
+from src.detection.figure_detector import (
+    NMS_IOU,
+    Figure,
+    calculate_iou,
+    collect_drawing_boxes,
+    detect_image_figures,
+    merge_figures,
+)
+
+PAGE_SIZE = {'px': (1275, 1650)}
+
+
+def _figure(bbox, source='vector', stroke_length=0):
+    return Figure(list(bbox), source, stroke_length)
+
+
+def _figures(figures):
+    return [(tuple(f.bbox_px), f.source, f.stroke_length) for f in figures]
+
+
+def _reference_merge_overlapping_figures(figures):
+    """Original merge_overlapping_figures"""
+    if not figures:
+        return None
+
+    if len(figures) == 1:
+        return figures[0]
+
+    x0 = min(f.bbox_px[0] for f in figures)
+    y0 = min(f.bbox_px[1] for f in figures)
+    x1 = max(f.bbox_px[2] for f in figures)
+    y1 = max(f.bbox_px[3] for f in figures)
+
+    avg_width = sum(f.bbox_px[2] - f.bbox_px[0] for f in figures) / len(figures)
+    avg_height = sum(f.bbox_px[3] - f.bbox_px[1] for f in figures) / len(figures)
+
+    max_width = avg_width * 3
+    max_height = avg_height * 3
+
+    current_width = x1 - x0
+    current_height = y1 - y0
+
+    if current_width > max_width:
+        center_x = (x0 + x1) / 2
+        x0 = int(center_x - max_width / 2)
+        x1 = int(center_x + max_width / 2)
+
+    if current_height > max_height:
+        center_y = (y0 + y1) / 2
+        y0 = int(center_y - max_height / 2)
+        y1 = int(center_y + max_height / 2)
+
+    sources = [f.source for f in figures]
+    if 'vector' in sources and 'image' in sources:
+        source = 'mixed'
+    elif 'vector' in sources:
+        source = 'vector'
+    else:
+        source = 'image'
+
+    total_stroke_length = sum(f.stroke_length for f in figures)
+
+    return Figure(
+        bbox_px=[x0, y0, x1, y1],
+        source=source,
+        stroke_length=total_stroke_length
+    )
+
+
+def _reference_merge_figures(figures):
+    """Original pairwise NMS loop"""
+    if not figures:
+        return []
+
+    figures = sorted(figures, key=lambda f: f.area, reverse=True)
+
+    merged = []
+    used = set()
+
+    for i, figure in enumerate(figures):
+        if i in used:
+            continue
+
+        overlapping = [i]
+        for j in range(i+1, len(figures)):
+            if j in used:
+                continue
+
+            if calculate_iou(figure, figures[j]) > NMS_IOU:
+                overlapping.append(j)
+                used.add(j)
+
+        if len(overlapping) == 1:
+            merged.append(figure)
+        else:
+            merged_figure = _reference_merge_overlapping_figures([figures[k] for k in overlapping])
+            merged.append(merged_figure)
+
+        used.add(i)
+
+    return merged
+
+
+def _reference_detect_image_figures(xobjects, columns, page_size):
+    """Original per-image loop"""
+    figures = []
+
+    page_w, page_h = page_size.get('px', (1275, 1650))
+    page_area = max(1, page_w * page_h)
+    min_dim = int(max(70, 0.06 * page_w))
+    min_area = int(max(8000, 0.004 * page_area))
+
+    for xobj in xobjects:
+        bbox_px = xobj['bbox_px']
+
+        image_center_x = (bbox_px[0] + bbox_px[2]) / 2
+        image_center_y = (bbox_px[1] + bbox_px[3]) / 2
+
+        in_column = False
+        for x0, x1 in columns:
+            if (x0 <= image_center_x < x1) or (bbox_px[0] < x1 and bbox_px[2] > x0):
+                in_column = True
+                break
+
+        if not columns:
+            in_column = True
+
+        if in_column:
+            w = max(1, bbox_px[2] - bbox_px[0])
+            h = max(1, bbox_px[3] - bbox_px[1])
+            area = w * h
+
+            aspect = w / h if h > 0 else 0
+
+            is_too_small = (w < min_dim) or (h < min_dim) or (area < min_area)
+            is_strip = (aspect > 8.0 and h < 50) or (aspect < 0.125 and w < 50)
+
+            is_small_square_icon = abs(w - h) <= 0.2 * max(w, h) and max(w, h) < (min_dim + 10)
+
+            if is_too_small or is_strip or is_small_square_icon:
+                logging.info(
+                    f"Skipping small/strip/icon image {bbox_px} (w={w}, h={h}, area={area})"
+                )
+                continue
+
+            padding = 8
+            padded_bbox = [
+                max(0, bbox_px[0] - padding),
+                max(0, bbox_px[1] - padding),
+                bbox_px[2] + padding,
+                bbox_px[3] + padding
+            ]
+
+            figure = Figure(
+                bbox_px=padded_bbox,
+                source='image',
+                stroke_length=0
+            )
+            figures.append(figure)
+            logging.info(f"Detected image figure: {padded_bbox}")
+
+    return figures
+
+
+def _random_images(rng):
+    """Images of every size class, many of them starting or ending on a column edge"""
+    columns = rng.choice([[], [(60, 620), (655, 1215)], [(100, 1175)], [(0, 300)], [(655, 1215), (60, 620)]])
+    edges = [x for column in columns for x in column] or [0]
+    xobjects = []
+    for _ in range(rng.randrange(0, 40)):
+        w = rng.choice([0, 20, 40, 75, 76, 80, 85, 120, 400, 900])
+        h = rng.choice([0, 20, 40, 75, 76, 80, 85, 120, 400, 900])
+        x0 = rng.choice([rng.randrange(0, 1200), rng.choice(edges), rng.choice(edges) - w, rng.choice(edges) - w // 2])
+        y0 = rng.randrange(0, 1600)
+        xobjects.append({'bbox_px': [x0, y0, x0 + w, y0 + h]})
+    return xobjects, columns, PAGE_SIZE
+
+
+def _random_figures(rng):
+    """Clustered figures with a few repeated sizes, so overlaps and equal areas are common"""
+    centers = [(rng.randrange(100, 1100), rng.randrange(100, 1500)) for _ in range(rng.randrange(1, 8))]
+    figures = []
+    for _ in range(rng.randrange(1, 40)):
+        cx, cy = rng.choice(centers)
+        x0 = cx + rng.randrange(-80, 80)
+        y0 = cy + rng.randrange(-80, 80)
+        w, h = rng.choice([(100, 100), (50, 200), (200, 50), (rng.randrange(1, 400), rng.randrange(1, 400))])
+        figures.append(_figure([x0, y0, x0 + w, y0 + h], rng.choice(['vector', 'image', 'mixed']),
+                               rng.randrange(0, 5000)))
+    return (figures,)
+
+
+@pytest.mark.unit
+class TestMergeFigures:
+    def test_empty(self):
+        assert merge_figures([]) == []
+
+    def test_single_figure_is_returned_as_is(self):
+        figure = _figure([0, 0, 10, 10])
+        assert merge_figures([figure]) == [figure]
+
+    def test_iou_at_threshold_does_not_merge(self):
+        # Nested boxes: IoU is the area ratio, exactly 0.4 here
+        outer = _figure([0, 0, 100, 100])
+        inner = _figure([0, 0, 100, 40])
+        assert _figures(merge_figures([inner, outer])) == _figures([outer, inner])
+
+    def test_iou_above_threshold_merges(self):
+        outer = _figure([0, 0, 100, 100], 'vector', 5)
+        inner = _figure([0, 0, 100, 41], 'image', 7)
+        assert _figures(merge_figures([inner, outer])) == [((0, 0, 100, 100), 'mixed', 12)]
+
+    def test_touching_figures_stay_separate(self):
+        left = _figure([0, 0, 100, 100])
+        right = _figure([100, 0, 200, 100])
+        assert merge_figures([left, right]) == [left, right]
+
+    def test_largest_first(self):
+        small = _figure([0, 0, 10, 10])
+        large = _figure([500, 500, 700, 700])
+        assert merge_figures([small, large]) == [large, small]
+
+    def test_equal_area_ties_keep_input_order(self):
+        # a and c only overlap through b, so the anchor chosen among the
+        # equal-area figures decides how many survive
+        a = _figure([0, 0, 100, 100])
+        b = _figure([30, 0, 130, 100])
+        c = _figure([60, 0, 160, 100])
+        assert _figures(merge_figures([a, b, c])) == [((0, 0, 130, 100), 'vector', 0), ((60, 0, 160, 100), 'vector', 0)]
+        assert _figures(merge_figures([b, a, c])) == [((0, 0, 160, 100), 'vector', 0)]
+
+    def test_matches_reference(self, assert_matches_reference):
+        assert_matches_reference(merge_figures, _reference_merge_figures, _random_figures,
+                                 normalize=_figures)
+
+
+@pytest.mark.unit
+class TestCollectDrawingBoxes:
+    def test_matches_int_conversion(self):
+        rects = [fitz.Rect(10.3, 20.7, 300.9, 400.1), fitz.Rect(-5.5, -1.2, 7.9, 3.3)]
+        boxes = collect_drawing_boxes([{'type': 's', 'rect': r} for r in rects])
+        for box, rect in zip(boxes, rects):
+            expected = [int(v * (150/72)) for v in (rect.x0, rect.y0, rect.x1, rect.y1)]
+            assert box['bbox'] == expected
+            assert box['area'] == (expected[2] - expected[0]) * (expected[3] - expected[1])
+
+    def test_huge_rects_do_not_overflow(self):
+        rects = [fitz.Rect(fitz.INFINITE_RECT()), fitz.Rect(0, 0, 30000, 30000)]
+        boxes = collect_drawing_boxes([{'type': 'f', 'rect': r} for r in rects])
+        for box, rect in zip(boxes, rects):
+            x0, y0, x1, y1 = (int(v * (150/72)) for v in (rect.x0, rect.y0, rect.x1, rect.y1))
+            assert box['bbox'] == [x0, y0, x1, y1]
+            assert box['area'] == (x1 - x0) * (y1 - y0)
+            assert box['area'] > 0
+
+    def test_skips_other_types_and_empty_rects(self):
+        drawings = [{'type': 'clip', 'rect': fitz.Rect(0, 0, 10, 10)}, {'type': 's', 'rect': None},
+                    {'type': 'fs', 'rect': fitz.Rect(0, 0, 10, 10)}]
+        assert collect_drawing_boxes(drawings) == []
+
+
+def _image(x0, y0, x1, y1):
+    return {'bbox_px': [x0, y0, x1, y1]}
+
+
+@pytest.mark.unit
+class TestDetectImageFigures:
+    def test_no_images(self):
+        assert detect_image_figures([], [(0, 600)], PAGE_SIZE) == []
+
+    def test_no_columns_accepts_every_image(self):
+        figures = detect_image_figures([_image(1200, 100, 1400, 300)], [], PAGE_SIZE)
+        assert _figures(figures) == [((1192, 92, 1408, 308), 'image', 0)]
+
+    def test_padding_is_clamped_at_the_origin_only(self):
+        figures = detect_image_figures([_image(3, 5, 203, 205)], [], PAGE_SIZE)
+        assert figures[0].bbox_px == [0, 0, 211, 213]
+
+    def test_center_on_column_end_is_kept_through_overlap(self):
+        figures = detect_image_figures([_image(500, 100, 700, 300)], [(0, 600)], PAGE_SIZE)
+        assert len(figures) == 1
+
+    def test_center_on_column_end_is_outside_the_column(self, caplog):
+        # A zero-width image at x1 only passes the center test with <= x1.
+        # Only in-column images reach the size filter and log a skip
+        with caplog.at_level(logging.INFO):
+            assert detect_image_figures([_image(600, 100, 600, 300)], [(0, 600)], PAGE_SIZE) == []
+            assert "Skipping" not in caplog.text
+            assert detect_image_figures([_image(0, 100, 0, 300)], [(0, 600)], PAGE_SIZE) == []
+            assert "Skipping" in caplog.text
+
+    def test_touching_column_start_is_outside(self):
+        assert detect_image_figures([_image(400, 100, 600, 300)], [(600, 1200)], PAGE_SIZE) == []
+
+    def test_minimum_dimension(self):
+        # min_dim is int(0.06 * 1275) = 76 and min_area 8415 on this page
+        kept = _image(100, 100, 176, 220)
+        too_narrow = _image(100, 100, 175, 220)
+        assert _figures(detect_image_figures([kept, too_narrow], [], PAGE_SIZE)) == \
+            [((92, 92, 184, 228), 'image', 0)]
+
+    def test_default_page_size(self):
+        xobjects = [_image(100, 100, 176, 220), _image(100, 100, 175, 220)]
+        assert _figures(detect_image_figures(xobjects, [], {})) == \
+            _figures(detect_image_figures(xobjects, [], PAGE_SIZE))
+
+    def test_matches_reference(self, assert_matches_reference):
+        assert_matches_reference(detect_image_figures, _reference_detect_image_figures,
+                                 _random_images, normalize=_figures)
@@ -0,0 +1,124 @@
+"""
+Tests for table-row classification
+"""
+import pytest
+
+from src.detection.text_detector import TextBlock
+from src.utils.ml_models import classify_tabular_rows, is_tabular_row
+
+PAGE_W, PAGE_H = 1275, 1650
+
+
+def _cell(x0, y0=100, text="12"):
+    return TextBlock([x0, y0, x0 + 20, y0 + 12], text)
+
+
+def _row(*xs, y0=100, text="12"):
+    return [_cell(x, y0, text) for x in xs]
+
+
+def _reference_is_tabular_row(row_blocks, page_width, page_height):
+    """Original is_tabular_row"""
+    if not row_blocks or len(row_blocks) < 2:
+        return False
+
+    texts = [block.text.strip() for block in row_blocks]
+
+    if any(len(text) > 40 for text in texts):
+        return False
+
+    sentence_indicators = ['.', '!', '?']
+    if any(any(indicator in text for indicator in sentence_indicators) for text in texts):
+        return False
+
+    descriptive_words = ['features', 'description', 'applications', 'simplified', 'schematic', 'figure']
+    if any(any(word in text.lower() for word in descriptive_words) for text in texts):
+        return False
+
+    x_coords = [block.bbox_px[0] for block in row_blocks]
+    y_coords = [block.bbox_px[1] for block in row_blocks]
+    x_coords.sort()
+
+    gaps = [x_coords[i+1] - x_coords[i] for i in range(len(x_coords)-1)]
+    if not gaps or min(gaps) < 30:
+        return False
+
+    y_variance = max(y_coords) - min(y_coords)
+    if y_variance > 15:
+        return False
+
+    if len(texts) >= 2:
+        total_width = x_coords[-1] - x_coords[0]
+        if total_width > 100:
+            return True
+
+    return False
+
+
+def _reference_classify(rows, page_width, page_height):
+    return [_reference_is_tabular_row(row, page_width, page_height) for row in rows]
+
+
+def _random_rows(rng):
+    texts = ["VIN", "3.3", "12 V", "Min", "Max", "mA", "-40 to 85", "Output voltage",
+             "See Figure 3", "Done!", "Simplified schematic", " padded ", "x" * 40, "x" * 41, ""]
+    rows = []
+    for _ in range(rng.randrange(0, 60)):
+        y = rng.randrange(50, 1600)
+        rows.append([
+            _cell(rng.randrange(50, 1150), y + rng.randrange(-9, 10), rng.choice(texts))
+            for _ in range(rng.randrange(1, 7))
+        ])
+    return rows, PAGE_W, PAGE_H
+
+
+@pytest.mark.unit
+class TestClassifyTabularRows:
+    def test_no_rows(self):
+        result = classify_tabular_rows([], PAGE_W, PAGE_H)
+        assert result.dtype == bool and result.shape == (0,)
+
+    def test_single_block_row_is_not_tabular(self):
+        assert list(classify_tabular_rows([_row(100)], PAGE_W, PAGE_H)) == [False]
+
+    def test_empty_row_among_others(self):
+        rows = [_row(100, 300), [], _row(100)]
+        assert list(classify_tabular_rows(rows, PAGE_W, PAGE_H)) == [True, False, False]
+
+    def test_gap_threshold_is_inclusive(self):
+        rows = [_row(100, 130, 230), _row(100, 129, 230)]
+        assert list(classify_tabular_rows(rows, PAGE_W, PAGE_H)) == [True, False]
+
+    def test_duplicate_x_has_zero_gap(self):
+        assert list(classify_tabular_rows([_row(100, 100, 300)], PAGE_W, PAGE_H)) == [False]
+
+    def test_y_spread_threshold_is_inclusive(self):
+        aligned = [_cell(100, 100), _cell(300, 115)]
+        misaligned = [_cell(100, 100), _cell(300, 116)]
+        assert list(classify_tabular_rows([aligned, misaligned], PAGE_W, PAGE_H)) == [True, False]
+
+    def test_span_must_exceed_limit(self):
+        rows = [_row(100, 200), _row(100, 201)]
+        assert list(classify_tabular_rows(rows, PAGE_W, PAGE_H)) == [False, True]
+
+    def test_unsorted_cells(self):
+        assert list(classify_tabular_rows([_row(400, 100, 250)], PAGE_W, PAGE_H)) == [True]
+
+    def test_text_rejections(self):
+        rows = [
+            _row(100, 300, text="x" * 40),
+            _row(100, 300, text="x" * 41),
+            _row(100, 300, text="  " + "x" * 40 + "  "),  # stripped before measuring
+            _row(100, 300, text="12.5"),
+            _row(100, 300, text="See FIGURE 3"),
+        ]
+        assert list(classify_tabular_rows(rows, PAGE_W, PAGE_H)) == [True, False, True, False, False]
+
+    def test_agrees_with_is_tabular_row(self, assert_matches_reference):
+        assert_matches_reference(lambda *args: list(classify_tabular_rows(*args)),
+                                 lambda rows, w, h: [is_tabular_row(row, w, h) for row in rows],
+                                 _random_rows)
+
+    def test_matches_reference(self, assert_matches_reference):
+        assert_matches_reference(classify_tabular_rows, _reference_classify, _random_rows,
+                                 normalize=lambda result: [bool(v) for v in result])
@@ -0,0 +1,120 @@
+"""
+Tests for pipeline-level figure filtering
+"""
+import logging
+
+import pytest
+
+from src.core.pipeline_processor import filter_figures_away_from_tables
+from src.detection.figure_detector import Figure
+from src.detection.table_detector import Table
+
+
+def _figure(bbox):
+    return Figure(list(bbox), 'vector')
+
+
+def _table(bbox):
+    return Table(list(bbox), [])
+
+
+def _ids(items):
+    return [id(item) for item in items]
+
+
+def _reference_filter_figures_away_from_tables(figures, tables):
+    """Original per-pair loop"""
+    if not tables:
+        return figures
+
+    filtered_figures = []
+
+    for figure in figures:
+        fig_bbox = figure.bbox_px
+        fig_x0, fig_y0, fig_x1, fig_y1 = fig_bbox
+
+        overlaps_with_table = False
+        for table in tables:
+            table_bbox = table.bbox_px
+            table_x0, table_y0, table_x1, table_y1 = table_bbox
+
+            overlap_x0 = max(fig_x0, table_x0)
+            overlap_y0 = max(fig_y0, table_y0)
+            overlap_x1 = min(fig_x1, table_x1)
+            overlap_y1 = min(fig_y1, table_y1)
+
+            if overlap_x0 < overlap_x1 and overlap_y0 < overlap_y1:
+                overlap_area = (overlap_x1 - overlap_x0) * (overlap_y1 - overlap_y0)
+                fig_area = (fig_x1 - fig_x0) * (fig_y1 - fig_y0)
+
+                if fig_area > 0 and overlap_area / fig_area > 0.5:
+                    overlaps_with_table = True
+                    logging.info(f"Filtering figure {fig_bbox} that overlaps with table {table_bbox}")
+                    break
+
+        if not overlaps_with_table:
+            filtered_figures.append(figure)
+
+    logging.info(f"Filtered {len(figures) - len(filtered_figures)} figures that overlapped with tables")
+    return filtered_figures
+
+
+def _random_box(rng):
+    x0 = rng.randrange(0, 1200)
+    y0 = rng.randrange(0, 1600)
+    return [x0, y0, x0 + rng.randrange(0, 400), y0 + rng.randrange(0, 400)]
+
+
+def _random_figures_and_tables(rng):
+    tables = [_table(_random_box(rng)) for _ in range(rng.randrange(0, 5))]
+    figures = [_figure(_random_box(rng)) for _ in range(rng.randrange(0, 30))]
+    # Figures cut from a table so the overlap ratio lands on both sides of 50%
+    for table in tables:
+        x0, y0, x1, y1 = table.bbox_px
+        cut = rng.choice([0.3, 0.5, 0.7])
+        figures.append(_figure([x0 - int((x1 - x0) * cut), y0, x1 - int((x1 - x0) * cut), y1]))
+    return figures, tables
+
+
+@pytest.mark.unit
+class TestFilterFiguresAwayFromTables:
+    def test_no_tables_keeps_every_figure(self):
+        figures = [_figure([0, 0, 10, 10])]
+        assert filter_figures_away_from_tables(figures, []) is figures
+
+    def test_no_figures(self):
+        assert filter_figures_away_from_tables([], [_table([0, 0, 10, 10])]) == []
+
+    def test_exactly_half_covered_is_kept(self):
+        figure = _figure([0, 0, 100, 100])
+        assert filter_figures_away_from_tables([figure], [_table([0, 0, 50, 100])]) == [figure]
+
+    def test_just_over_half_covered_is_dropped(self):
+        figure = _figure([0, 0, 100, 100])
+        assert filter_figures_away_from_tables([figure], [_table([0, 0, 51, 100])]) == []
+
+    def test_touching_boxes_do_not_overlap(self):
+        figure = _figure([0, 0, 100, 100])
+        assert filter_figures_away_from_tables([figure], [_table([100, 0, 200, 100])]) == [figure]
+
+    def test_figure_nested_in_table_is_dropped(self):
+        figure = _figure([20, 20, 40, 40])
+        assert filter_figures_away_from_tables([figure], [_table([0, 0, 100, 100])]) == []
+
+    def test_table_nested_in_large_figure_is_kept(self):
+        figure = _figure([0, 0, 100, 100])
+        assert filter_figures_away_from_tables([figure], [_table([20, 20, 40, 40])]) == [figure]
+
+    def test_coverage_is_per_table_not_summed(self):
+        figure = _figure([0, 0, 100, 100])
+        tables = [_table([0, 0, 40, 100]), _table([60, 0, 100, 100])]
+        assert filter_figures_away_from_tables([figure], tables) == [figure]
+
+    def test_zero_area_figure_is_kept(self):
+        figure = _figure([10, 10, 10, 50])
+        assert filter_figures_away_from_tables([figure], [_table([0, 0, 100, 100])]) == [figure]
+
+    def test_matches_reference(self, assert_matches_reference):
+        assert_matches_reference(filter_figures_away_from_tables,
+                                 _reference_filter_figures_away_from_tables,
+                                 _random_figures_and_tables, normalize=_ids)
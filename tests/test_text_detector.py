@@ -0,0 +1,275 @@
+"""
+Tests for text block filtering and grouping
+"""
+import re
+
+import numpy as np
+import pytest
+
+from src.detection.text_detector import (
+    ROW_DY_FACTOR,
+    TEXT_MERGE_VGAP,
+    TextBlock,
+    filter_blocks_in_columns,
+    group_lines_into_paragraphs,
+)
+
+
+def _block(x0, x1, y0=100, y1=112, text="text"):
+    return TextBlock([x0, y0, x1, y1], text)
+
+
+def _ids(blocks):
+    return [id(block) for block in blocks]
+
+
+def _paragraphs(blocks):
+    return [(tuple(b.bbox_px), b.text, float(b.font_size), b.is_bold, b.is_italic) for b in blocks]
+
+
+def _reference_fix_hyphenations(text):
+    """Original fix_hyphenations"""
+    text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+    text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def _reference_merge_blocks_to_paragraph(blocks):
+    """Original merge_blocks_to_paragraph"""
+    if not blocks:
+        return None
+
+    if len(blocks) == 1:
+        return blocks[0]
+
+    x0 = min(b.bbox_px[0] for b in blocks)
+    y0 = min(b.bbox_px[1] for b in blocks)
+    x1 = max(b.bbox_px[2] for b in blocks)
+    y1 = max(b.bbox_px[3] for b in blocks)
+
+    text_parts = []
+    for block in blocks:
+        text_parts.append(block.text)
+
+    combined_text = " ".join(text_parts)
+    combined_text = _reference_fix_hyphenations(combined_text)
+
+    font_sizes = [b.font_size for b in blocks if b.font_size > 0]
+    avg_font_size = np.mean(font_sizes) if font_sizes else 12
+
+    is_bold = any(b.is_bold for b in blocks)
+    is_italic = any(b.is_italic for b in blocks)
+
+    return TextBlock(
+        bbox_px=[x0, y0, x1, y1],
+        text=combined_text,
+        font_size=avg_font_size,
+        is_bold=is_bold,
+        is_italic=is_italic
+    )
+
+
+def _reference_group_lines_into_paragraphs(blocks):
+    """Original line grouping loop"""
+    if not blocks:
+        return []
+
+    blocks = sorted(blocks, key=lambda b: (b.bbox_px[1], b.bbox_px[0]))
+
+    heights = [b.height for b in blocks]
+    median_height = np.median(heights)
+    baseline_threshold = median_height * ROW_DY_FACTOR
+
+    line_groups = []
+    current_group = [blocks[0]]
+
+    for i in range(1, len(blocks)):
+        prev_block = blocks[i-1]
+        curr_block = blocks[i]
+
+        y_diff = abs(curr_block.bbox_px[1] - prev_block.bbox_px[1])
+        x_diff = abs(curr_block.bbox_px[0] - prev_block.bbox_px[0])
+        page_width = 1275
+        column_threshold = page_width * 0.3
+
+        if y_diff <= baseline_threshold and x_diff <= column_threshold:
+            current_group.append(curr_block)
+        else:
+            line_groups.append(current_group)
+            current_group = [curr_block]
+
+    if current_group:
+        line_groups.append(current_group)
+
+    paragraphs = []
+    for group in line_groups:
+        if not group:
+            continue
+
+        group = sorted(group, key=lambda b: b.bbox_px[0])
+
+        merged_blocks = []
+        current_para = [group[0]]
+
+        for i in range(1, len(group)):
+            prev_block = group[i-1]
+            curr_block = group[i]
+
+            vgap = curr_block.bbox_px[1] - prev_block.bbox_px[3]
+
+            prev_right = prev_block.bbox_px[2]
+            curr_left = curr_block.bbox_px[0]
+            hgap = curr_left - prev_right
+
+            if vgap <= TEXT_MERGE_VGAP and hgap <= 50:
+                current_para.append(curr_block)
+            else:
+                if current_para:
+                    merged_blocks.append(_reference_merge_blocks_to_paragraph(current_para))
+                current_para = [curr_block]
+
+        if current_para:
+            merged_blocks.append(_reference_merge_blocks_to_paragraph(current_para))
+
+        paragraphs.extend(merged_blocks)
+
+    return paragraphs
+
+
+def _random_lines(rng):
+    """Jittered text lines in up to three columns, with repeated coordinates"""
+    words = ["data", "sheet", "power", "exam-", "ple", "switch-", "ing", "Vout", "12.5"]
+    blocks = []
+    for _ in range(rng.randrange(1, 80)):
+        x0 = rng.choice([60, 90, 460, 480, 860]) + rng.choice([0, 0, 10, 40, 120])
+        y0 = 80 + rng.randrange(40) * 18 + rng.randrange(-4, 5)
+        height = rng.choice([10, 12, 12, 14, 20])
+        blocks.append(TextBlock(
+            [x0, y0, x0 + rng.randrange(20, 300), y0 + height],
+            " ".join(rng.choice(words) for _ in range(rng.randrange(1, 4))),
+            font_size=rng.choice([0, 9.0, 10.0, 12.0, 14.0]),
+            is_bold=rng.random() < 0.2,
+            is_italic=rng.random() < 0.1,
+        ))
+    return (blocks,)
+
+
+def _reference_filter_blocks_in_columns(blocks, columns):
+    """Original per-block loop"""
+    if not columns:
+        return blocks
+
+    filtered = []
+    for block in blocks:
+        center_x = block.center_x
+        for x0, x1 in columns:
+            if x0 <= center_x < x1:
+                filtered.append(block)
+                break
+
+    return filtered
+
+
+def _random_column_page(rng):
+    """Blocks spread over the page, and disjoint columns as detect_columns returns them"""
+    blocks = []
+    for _ in range(rng.randrange(0, 60)):
+        x0 = rng.randrange(0, 1200)
+        blocks.append(_block(x0, x0 + rng.randrange(1, 400)))
+    edges = sorted(rng.sample(range(0, 1276, 5), 2 * rng.randrange(1, 4)))
+    columns = [(edges[i], edges[i + 1]) for i in range(0, len(edges), 2)]
+    rng.shuffle(columns)
+    return blocks, columns
+
+
+@pytest.mark.unit
+class TestFilterBlocksInColumns:
+    def test_no_columns_keeps_every_block(self):
+        blocks = [_block(10, 20), _block(500, 600)]
+        assert filter_blocks_in_columns(blocks, []) is blocks
+
+    def test_no_blocks(self):
+        assert filter_blocks_in_columns([], [(0, 600)]) == []
+
+    def test_center_on_column_start_is_kept(self):
+        block = _block(80, 120)  # center 100
+        assert filter_blocks_in_columns([block], [(100, 600)]) == [block]
+
+    def test_center_on_column_end_is_dropped(self):
+        block = _block(580, 620)  # center 600
+        assert filter_blocks_in_columns([block], [(100, 600)]) == []
+
+    def test_center_on_shared_boundary_goes_to_right_column(self):
+        columns = [(0, 600), (600, 1275)]
+        block = _block(580, 620)
+        assert filter_blocks_in_columns([block], columns) == [block]
+        assert filter_blocks_in_columns([block], columns[:1]) == []
+
+    def test_half_pixel_center(self):
+        block = _block(99, 100)  # center 99.5
+        assert filter_blocks_in_columns([block], [(100, 600)]) == []
+        assert filter_blocks_in_columns([block], [(99, 100)]) == [block]
+
+    def test_centers_in_gutter_or_outside_are_dropped(self):
+        columns = [(60, 620), (655, 1215)]
+        kept = [_block(100, 200), _block(700, 800)]
+        dropped = [_block(0, 20), _block(630, 650), _block(1230, 1270)]
+        assert _ids(filter_blocks_in_columns(dropped + kept, columns)) == _ids(kept)
+
+    def test_unsorted_columns_keep_block_order(self):
+        blocks = [_block(700, 800), _block(100, 200), _block(900, 1000)]
+        result = filter_blocks_in_columns(blocks, [(655, 1215), (60, 620)])
+        assert _ids(result) == _ids(blocks)
+
+    def test_matches_reference(self, assert_matches_reference):
+        assert_matches_reference(filter_blocks_in_columns, _reference_filter_blocks_in_columns,
+                                 _random_column_page, normalize=_ids)
+
+
+@pytest.mark.unit
+class TestGroupLinesIntoParagraphs:
+    def test_empty(self):
+        assert group_lines_into_paragraphs([]) == []
+
+    def test_single_line_is_returned_as_is(self):
+        block = _block(0, 100)
+        assert group_lines_into_paragraphs([block]) == [block]
+
+    def test_baseline_threshold_is_inclusive(self):
+        # Line height 10, so lines whose tops are <= 6 px apart share a row
+        first = _block(0, 100, 100, 110, "first")
+        assert len(group_lines_into_paragraphs([first, _block(120, 200, 106, 116, "second")])) == 1
+        assert len(group_lines_into_paragraphs([first, _block(120, 200, 107, 117, "second")])) == 2
+
+    def test_column_threshold(self):
+        # 30% of the 1275 px page: starts 382 px apart share a row, 383 don't
+        first = _block(0, 400, 100, 110, "first")
+        assert len(group_lines_into_paragraphs([first, _block(382, 420, 100, 110, "second")])) == 1
+        assert len(group_lines_into_paragraphs([first, _block(383, 420, 100, 110, "second")])) == 2
+
+    def test_horizontal_gap_limit(self):
+        first = _block(0, 100, 100, 110, "first")
+        assert len(group_lines_into_paragraphs([first, _block(150, 200, 100, 110, "second")])) == 1
+        assert len(group_lines_into_paragraphs([first, _block(151, 200, 100, 110, "second")])) == 2
+
+    def test_identical_positions_keep_input_order(self):
+        a = _block(0, 50, 100, 110, "first")
+        b = _block(0, 50, 100, 110, "second")
+        assert group_lines_into_paragraphs([a, b])[0].text == "first second"
+        assert group_lines_into_paragraphs([b, a])[0].text == "second first"
+
+    def test_merged_paragraph_fields(self):
+        a = TextBlock([0, 100, 100, 110], "switch-", font_size=10.0, is_bold=True)
+        b = TextBlock([110, 102, 200, 114], "ing", font_size=0)
+        c = TextBlock([190, 98, 260, 108], "mode", font_size=14.0, is_italic=True)
+        [paragraph] = group_lines_into_paragraphs([c, b, a])
+        assert paragraph.bbox_px == [0, 98, 260, 114]
+        assert paragraph.text == "switching mode"
+        assert paragraph.font_size == 12.0
+        assert paragraph.is_bold and paragraph.is_italic
+
+    def test_matches_reference(self, assert_matches_reference):
+        assert_matches_reference(group_lines_into_paragraphs,
+                                 _reference_group_lines_into_paragraphs,
+                                 _random_lines, normalize=_paragraphs)